@@ -7,7 +7,7 @@ from __future__ import annotations
 import json
 import sys
 from pathlib import Path
-from typing import cast
+from typing import Final, cast
 
 import click
 
@@ -72,11 +72,11 @@ def patch(json_patch_file_path: str, recipe_file_path: str) -> None:
 
     error_code = ExitCode.SUCCESS
     try:
-        for patch_blob in contents_json:
-            if not recipe_parser.patch(patch_blob):
-                print_err(f"Couldn't perform the patch: {patch_blob}.")
-                error_code = ExitCode.ILLEGAL_OPERATION
-                break
+        # Patching stops at the first patch that fails.
+        results: Final[list[bool]] = recipe_parser.patch_many(contents_json, stop_on_failure=True)
+        if not all(results):
+            print_err(f"Couldn't perform the patch: {contents_json[len(results) - 1]}.")
+            error_code = ExitCode.ILLEGAL_OPERATION
     except JsonPatchValidationException:
         print_err("The patch provided did not follow the expected schema.")
         error_code = ExitCode.JSON_ERROR
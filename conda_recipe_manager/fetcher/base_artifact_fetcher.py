@@ -24,6 +24,9 @@ class BaseArtifactFetcher(metaclass=ABCMeta):
     when the Artifact Fetcher instance falls out of scope.
     """
 
+    # Derived classes must declare the attributes they add in their own `__slots__`.
+    __slots__ = ("_name", "_temp_dir", "_temp_dir_path", "_successfully_fetched")
+
     def __init__(self, name: str) -> None:
         """
         Constructs a BaseArtifactFetcher.
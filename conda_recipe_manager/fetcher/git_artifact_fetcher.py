@@ -31,6 +31,8 @@ class GitArtifactFetcher(BaseArtifactFetcher):
     Artifact Fetcher capable of cloning a remote git repository.
     """
 
+    __slots__ = ("_is_remote", "_git_target")
+
     def __init__(
         self, name: str, url: str, branch: Optional[str] = None, tag: Optional[str] = None, rev: Optional[str] = None
     ):
@@ -4,6 +4,9 @@
 
 from __future__ import annotations
 
+import concurrent.futures as cf
+import hashlib
+import multiprocessing as mp
 import tarfile
 import zipfile
 from enum import Enum, auto
@@ -15,10 +18,29 @@ import requests
 
 from conda_recipe_manager.fetcher.base_artifact_fetcher import BaseArtifactFetcher
 from conda_recipe_manager.fetcher.exceptions import FetchError
-from conda_recipe_manager.utils.cryptography.hashing import hash_file
 
 # Default download timeout for artifacts
 _DOWNLOAD_TIMEOUT: Final[int] = 5 * 60  # 5 minutes
+# Buffer size used when downloading and extracting archives. Larger buffers mean fewer system calls per file.
+_COPY_BUFSIZE: Final[int] = 1024 * 1024  # 1MiB
+# Zip archives with fewer files than this are extracted on a single thread.
+_ZIP_PARALLEL_MIN_MEMBERS: Final[int] = 4
+# Maximum number of threads used to extract a single zip archive.
+_ZIP_MAX_WORKERS: Final[int] = 8
+
+
+def _extract_zip_members(archive_path: Path, members: list[zipfile.ZipInfo], path: Path) -> None:
+    """
+    Extracts a subset of files from a zip archive. Every caller opens its own handle to the archive, so that threads do
+    not contend over a shared file pointer.
+
+    :param archive_path: Path to the zip archive
+    :param members: Files in the archive to extract
+    :param path: Directory to extract the files into
+    """
+    with zipfile.ZipFile(archive_path) as zip_file:
+        for member in members:
+            zip_file.extract(member, path=path)
 
 
 class ArtifactArchiveType(Enum):
@@ -38,6 +60,8 @@ class HttpArtifactFetcher(BaseArtifactFetcher):
     Artifact Fetcher capable of downloading a software archive from a remote HTTP/HTTPS source.
     """
 
+    __slots__ = ("_archive_url", "_archive_type", "_archive_sha256", "_archive_path", "_uncompressed_archive_path")
+
     def __init__(self, name: str, archive_url: str):
         """
         Constructs an `HttpArtifactFetcher` instance.
@@ -49,6 +73,8 @@ class HttpArtifactFetcher(BaseArtifactFetcher):
         super().__init__(name)
         self._archive_url = archive_url
         self._archive_type = ArtifactArchiveType.UNKNOWN
+        # SHA-256 hash of the archive, calculated as the archive is downloaded.
+        self._archive_sha256 = ""
 
         # We use `urlparse` to extract the file path containing the archive. This can be used to get the archive's file
         # name. Many of the archive files we deal with contain the version number with period markings. We also work
@@ -61,6 +87,47 @@ class HttpArtifactFetcher(BaseArtifactFetcher):
         self._archive_path: Final[Path] = self._temp_dir_path / archive_file_name
         self._uncompressed_archive_path: Final[Path] = self._temp_dir_path / extracted_dir_name
 
+    def _extract_zip(self) -> None:
+        """
+        Extracts a zip archive. Zip members are compressed independently, so larger archives are extracted in parallel.
+        """
+        # TODO improve security checks
+        with zipfile.ZipFile(self._archive_path) as zip_file:
+            members: Final[list[zipfile.ZipInfo]] = zip_file.infolist()
+            if len(members) < _ZIP_PARALLEL_MIN_MEMBERS:
+                zip_file.extractall(path=self._uncompressed_archive_path)
+                return
+
+            # `ZipFile.extract()` fails if another thread creates the same parent directory at the same time. To avoid
+            # this, directories and the first file found in each directory are extracted before starting any threads.
+            extracted_dirs: set[str] = set()
+            remaining: list[zipfile.ZipInfo] = []
+            for member in members:
+                parent_dir = member.filename.rstrip("/").rpartition("/")[0]
+                if member.is_dir() or parent_dir not in extracted_dirs:
+                    zip_file.extract(member, path=self._uncompressed_archive_path)
+                    extracted_dirs.add(parent_dir)
+                    continue
+                remaining.append(member)
+
+        if not remaining:
+            return
+
+        thread_pool_size: Final[int] = min(_ZIP_MAX_WORKERS, mp.cpu_count(), len(remaining))
+        with cf.ThreadPoolExecutor(max_workers=thread_pool_size) as executor:
+            futures = [
+                executor.submit(
+                    _extract_zip_members,
+                    self._archive_path,
+                    remaining[i::thread_pool_size],
+                    self._uncompressed_archive_path,
+                )
+                for i in range(thread_pool_size)
+            ]
+            # Re-raise any exception encountered by a worker thread.
+            for future in cf.as_completed(futures):
+                future.result()
+
     def _extract(self) -> None:
         """
         Retrieves the build artifact and source code and dumps it to a secure temporary location.
@@ -71,14 +138,16 @@ class HttpArtifactFetcher(BaseArtifactFetcher):
             match self._archive_path:
                 case path if tarfile.is_tarfile(path):
                     self._archive_type = ArtifactArchiveType.TARBALL
-                    with tarfile.open(self._archive_path, mode="r") as tar_file:
+                    # `tarfile.open()` passes `copybufsize` on to `TarFile`, but `typeshed` does not declare it.
+                    tar_file: tarfile.TarFile
+                    with tarfile.open(  # type: ignore[call-overload,misc]
+                        self._archive_path, mode="r", copybufsize=_COPY_BUFSIZE
+                    ) as tar_file:
                         # The `filter="data"` parameter guards against "the most dangerous security issues"
                         tar_file.extractall(path=self._uncompressed_archive_path, filter="data")
                 case path if zipfile.is_zipfile(path):
                     self._archive_type = ArtifactArchiveType.ZIP
-                    with zipfile.ZipFile(self._archive_path) as zip_file:
-                        # TODO improve security checks
-                        zip_file.extractall(path=self._uncompressed_archive_path)
+                    self._extract_zip()
                 # TODO 7-zip support
                 case _:
                     raise FetchError("The archive type could not be identified.")
@@ -93,20 +162,24 @@ class HttpArtifactFetcher(BaseArtifactFetcher):
 
         :raises FetchError: If an issue occurred while downloading or extracting the archive.
         """
-        # Buffered download approach
+        # Buffered download approach. The archive is hashed as it is streamed to disk, so that the file does not need
+        # to be read again to calculate the hash.
+        archive_hash = hashlib.sha256()
         try:
             response = requests.get(str(self._archive_url), stream=True, timeout=_DOWNLOAD_TIMEOUT)
             with open(self._archive_path, "wb") as archive:
-                for chunk in cast(Iterator[bytes], response.iter_content(chunk_size=1024)):
+                for chunk in cast(Iterator[bytes], response.iter_content(chunk_size=_COPY_BUFSIZE)):
                     if not chunk:
                         break
                     archive.write(chunk)
+                    archive_hash.update(chunk)
         except requests.exceptions.RequestException as e:  # type: ignore[misc]
             raise FetchError("An HTTP error occurred while fetching the archive.") from e
         except IOError as e:
             raise FetchError("A file system error occurred while fetching the archive.") from e
 
         self._extract()
+        self._archive_sha256 = archive_hash.hexdigest()
 
         # If we have not thrown at this point, we have successfully fetched the archive.
         self._successfully_fetched = True
@@ -125,13 +198,14 @@ class HttpArtifactFetcher(BaseArtifactFetcher):
 
     def get_archive_sha256(self) -> str:
         """
-        Calculates a SHA-256 hash on the downloaded software archive.
+        Returns the SHA-256 hash of the downloaded software archive. The hash is calculated while the archive is being
+        downloaded.
 
         :raises FetchRequiredError: If `fetch()` has not been successfully invoked.
         """
         self._fetch_guard("Archive has not been downloaded, so the file can't be hashed.")
 
-        return hash_file(self._archive_path, "sha256")
+        return self._archive_sha256
 
     def get_archive_type(self) -> ArtifactArchiveType:
         """
@@ -49,6 +49,9 @@ class CbcParser(RecipeReader):
         """
         super().__init__(content)
         self._cbc_vars_tbl: _CbcTable = {}
+        # Caches the results of evaluating selectors against a query, per variable. A `SentinelType` value indicates
+        # that no value applies to the query. CBC parsers cannot be edited, so cached results never become stale.
+        self._cbc_query_cache: dict[tuple[str, SelectorQuery], Primitives | SentinelType] = {}
 
         # TODO Handle special cases:
         #   - pin_run_as_build
@@ -130,9 +133,20 @@ class CbcParser(RecipeReader):
         if len(cbc_entries) == 1 and cbc_entries[0].selector is None:
             return cbc_entries[0].value
 
-        for entry in cbc_entries:
-            if entry.selector is None or entry.selector.does_selector_apply(query):
-                return entry.value
+        # Evaluating selectors is comparatively expensive, so results are cached per variable and query.
+        cache_key: Final[tuple[str, SelectorQuery]] = (variable, query)
+        if cache_key not in self._cbc_query_cache:
+            self._cbc_query_cache[cache_key] = next(
+                (
+                    entry.value
+                    for entry in cbc_entries
+                    if entry.selector is None or entry.selector.does_selector_apply(query)
+                ),
+                SentinelType(),
+            )
+        value: Final[Primitives | SentinelType] = self._cbc_query_cache[cache_key]
+        if not isinstance(value, SentinelType):
+            return value
 
         # No applicable entries have been found to match any selector variant.
         if isinstance(default, SentinelType):
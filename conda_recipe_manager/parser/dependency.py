@@ -4,8 +4,9 @@
 
 from __future__ import annotations
 
+import functools
 from enum import Enum, auto
-from typing import NamedTuple, Optional, cast
+from typing import Final, NamedTuple, Optional, cast
 
 from conda.models.match_spec import InvalidMatchSpec, MatchSpec
 
@@ -32,6 +33,23 @@ class DependencySection(Enum):
     TESTS = auto()
 
 
+# Maximum number of unique dependency strings to cache `MatchSpec` instances for
+_MATCH_SPEC_CACHE_SIZE: Final[int] = 4096
+
+# Maps sanitized dependency section strings to their enumeration
+_STR_TO_DEPENDENCY_SECTION: Final[dict[str, DependencySection]] = {
+    "build": DependencySection.BUILD,
+    "host": DependencySection.HOST,
+    "run": DependencySection.RUN,
+    "run_constrained": DependencySection.RUN_CONSTRAINTS,  # V0
+    "run_constraints": DependencySection.RUN_CONSTRAINTS,  # V1
+    "run_exports": DependencySection.RUN_EXPORTS,
+    # This is included for the sake of completeness. Realistically, test dependencies should be detected by looking at
+    # the testing section, not `/requirements`.
+    "requires": DependencySection.TESTS,
+}
+
+
 class DependencyConflictMode(Enum):
     """
     Mode of operation to use when handling duplicate dependencies (identified by name).
@@ -96,26 +114,10 @@ def str_to_dependency_section(s: str) -> Optional[DependencySection]:
     :param s: Target string to convert
     :returns: String equivalent of the recipe schema. None if the string is unrecognized.
     """
-    # `match` is used here so the static analyzer can ensure all cases are covered
-    match s.strip().lower():
-        case "build":
-            return DependencySection.BUILD
-        case "host":
-            return DependencySection.HOST
-        case "run":
-            return DependencySection.RUN
-        case "run_constrained":  # V0
-            return DependencySection.RUN_CONSTRAINTS
-        case "run_constraints":  # V1
-            return DependencySection.RUN_CONSTRAINTS
-        case "run_exports":
-            return DependencySection.RUN_EXPORTS
-        # This is included for the sake of completeness. Realistically, test dependencies should be detected by looking
-        # at the testing section, not `/requirements`.
-        case "requires":
-            return DependencySection.TESTS
-        case _:
-            return None
+    # Section keys in recipe files are almost always already sanitized, so the string is only normalized on a miss.
+    if s in _STR_TO_DEPENDENCY_SECTION:
+        return _STR_TO_DEPENDENCY_SECTION[s]
+    return _STR_TO_DEPENDENCY_SECTION.get(s.strip().lower())
 
 
 class DependencyVariable:
@@ -123,6 +125,8 @@ class DependencyVariable:
     Represents a dependency that contains a JINJA variable that is unable to be resolved by the recipe's variable table.
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, s: str):
         """
         Constructs a DependencyVariable instance.
@@ -158,6 +162,20 @@ class DependencyVariable:
 DependencyData = MatchSpec | DependencyVariable
 
 
+@functools.lru_cache(maxsize=_MATCH_SPEC_CACHE_SIZE)  # type: ignore[misc]
+def _match_spec_from_str(s: str) -> MatchSpec:
+    """
+    Constructs a `MatchSpec` from a dependency string. Constructing a `MatchSpec` is expensive and recipes tend to share
+    the same dependency strings, so results are cached. `MatchSpec` instances are immutable, so sharing them is safe.
+
+    :param s: String to process.
+    :raises ValueError: If the string is not a valid `MatchSpec`.
+    :raises InvalidMatchSpec: If the string is not a valid `MatchSpec`.
+    :returns: A `MatchSpec` instance.
+    """
+    return MatchSpec(s)
+
+
 def dependency_data_from_str(s: str) -> DependencyData:
     """
     Constructs a `DependencyData` object from a dependency string in a recipe file.
@@ -165,11 +183,13 @@ def dependency_data_from_str(s: str) -> DependencyData:
     :param s: String to process.
     :returns: A `DependencyData` instance.
     """
-    if Regex.JINJA_V0_SUB.search(s) or Regex.JINJA_V1_SUB.search(s):
+    # Every V1 substitution (`${{ var }}`) contains a V0 substitution (`{{ var }}`), so one pattern detects both. Most
+    # dependencies contain no JINJA at all, so a cheap substring check avoids running the regular expression.
+    if "{{" in s and Regex.JINJA_V0_SUB.search(s):
         return DependencyVariable(s)
 
     try:
-        return MatchSpec(s)
+        return _match_spec_from_str(s)
     except (ValueError, InvalidMatchSpec):
         # In an effort to be more resilient, fallback to the simpler type.
         return DependencyVariable(s)
@@ -19,9 +19,10 @@ from __future__ import annotations
 
 import difflib
 import re
+from collections.abc import Sequence
 from typing import Final, Optional, TypeGuard, cast
 
-from jsonschema import validate as schema_validate
+from jsonschema.validators import validator_for
 
 from conda_recipe_manager.parser._node import Node
 from conda_recipe_manager.parser._traverse import (
@@ -47,6 +48,9 @@ class RecipeParser(RecipeReader):
 
     # Static set of patch operations that require `from`. The others require `value` or nothing.
     _patch_ops_requiring_from = set(["copy", "move"])
+    # Static validator for the JSON patch schema. Constructing a validator is costly, so it is built once and shared by
+    # all `patch()` calls.
+    _patch_schema_validator = validator_for(JSON_PATCH_SCHEMA)(JSON_PATCH_SCHEMA)
 
     ## Recipe Key Sorting ##
 
@@ -521,26 +525,27 @@ class RecipeParser(RecipeReader):
         # This should be unreachable but is kept for completeness.
         return False
 
-    def patch(self, patch: JsonPatchType) -> bool:
+    @staticmethod
+    def _validate_patch(patch: JsonPatchType) -> None:
         """
-        Given a JSON-patch object, perform a patch operation.
+        Validates a JSON-patch object against our schema.
 
-        Modifications from RFC 6902
-          - We're using a Jinja-formatted YAML file, not JSON
-          - To modify comments, specify the `path` AND `comment`
-
-        :param patch: JSON-patch payload to operate with.
+        :param patch: JSON-patch payload to validate.
         :raises JsonPatchValidationException: If the JSON-patch payload does not conform to our schema/spec.
-        :returns: If the calling code attempts to perform the `test` operation, this indicates the return value of the
-            `test` request. In other words, if `value` matches the target variable, return True. False otherwise. For
-            all other operations, this indicates if the operation was successful.
         """
-        # Validate the patch schema
         try:
-            schema_validate(patch, JSON_PATCH_SCHEMA)
+            RecipeParser._patch_schema_validator.validate(patch)
         except Exception as e:
             raise JsonPatchValidationException(patch) from e
 
+    def _apply_patch(self, patch: JsonPatchType) -> tuple[bool, bool]:
+        """
+        Performs a pre-validated patch operation, without updating the selector table.
+
+        :param patch: JSON-patch payload to operate with.
+        :returns: A tuple containing the result of the patch operation (see `patch()`) and a flag indicating if the
+            parse tree was modified.
+        """
         path: Final[str] = cast(str, patch["path"])
 
         # All RFC ops are supported, so the JSON schema validation checks will prevent us from getting this far, if
@@ -550,21 +555,72 @@ class RecipeParser(RecipeReader):
         # A no-op move is silly, but we might as well make it efficient AND ensure a no-op move doesn't corrupt our
         # modification flag.
         if op == "move" and path == patch["from"]:
-            return True
+            return True, False
 
         # Both versions of the path are sent over so that the op can easily use both private and public functions
         # (without incurring even more conversions between path types).
-        is_successful = self._call_patch_op(op, path, patch)
+        is_successful: Final[bool] = self._call_patch_op(op, path, patch)
+        is_tree_modified: Final[bool] = is_successful and op != "test"
+        if is_tree_modified:
+            # TODO technically this doesn't handle a no-op.
+            self._is_modified = True
+        return is_successful, is_tree_modified
+
+    def patch(self, patch: JsonPatchType) -> bool:
+        """
+        Given a JSON-patch object, perform a patch operation.
 
-        # Update the selector table and modified flag, if the operation succeeded.
-        if is_successful and op != "test":
+        Modifications from RFC 6902
+          - We're using a Jinja-formatted YAML file, not JSON
+          - To modify comments, specify the `path` AND `comment`
+
+        :param patch: JSON-patch payload to operate with.
+        :raises JsonPatchValidationException: If the JSON-patch payload does not conform to our schema/spec.
+        :returns: If the calling code attempts to perform the `test` operation, this indicates the return value of the
+            `test` request. In other words, if `value` matches the target variable, return True. False otherwise. For
+            all other operations, this indicates if the operation was successful.
+        """
+        RecipeParser._validate_patch(patch)
+        is_successful, is_tree_modified = self._apply_patch(patch)
+
+        # Update the selector table, if the operation succeeded.
+        if is_tree_modified:
             # TODO this is not the most efficient way to update the selector table, but for now, it works.
             self._rebuild_selectors()
-            # TODO technically this doesn't handle a no-op.
-            self._is_modified = True
 
         return is_successful
 
+    def patch_many(self, patches: Sequence[JsonPatchType], stop_on_failure: bool = False) -> list[bool]:
+        """
+        Given a sequence of JSON-patch objects, perform each patch operation in order. This is equivalent to calling
+        `patch()` on every patch, except that:
+          - Every patch is validated before any patch is performed. An invalid patch leaves the recipe untouched.
+          - The selector look-up table is only rebuilt once, after all patches have been performed.
+
+        Each patch operates on the results of the patches before it.
+
+        :param patches: JSON-patch payloads to operate with, in order.
+        :param stop_on_failure: (Optional) If set to `True`, no further patches are performed after a patch fails.
+            Otherwise, a failed patch does not stop later patches from being performed.
+        :raises JsonPatchValidationException: If any JSON-patch payload does not conform to our schema/spec.
+        :returns: The result of each patch operation that was performed, in order. See `patch()` for details.
+        """
+        for patch in patches:
+            RecipeParser._validate_patch(patch)
+
+        results: list[bool] = []
+        should_rebuild_selectors = False
+        for patch in patches:
+            is_successful, is_tree_modified = self._apply_patch(patch)
+            results.append(is_successful)
+            should_rebuild_selectors |= is_tree_modified
+            if stop_on_failure and not is_successful:
+                break
+
+        if should_rebuild_selectors:
+            self._rebuild_selectors()
+        return results
+
     def search_and_patch(
         self, regex: str | re.Pattern[str], patch: JsonPatchType, include_comment: bool = False
     ) -> bool:
@@ -579,11 +635,7 @@ class RecipeParser(RecipeReader):
         :returns: Returns a list of paths where the matched value was found.
         """
         paths = self.search(regex, include_comment)
-        summation: bool = True
-        for path in paths:
-            patch["path"] = path
-            summation = summation and self.patch(patch)
-        return summation
+        return all(self.patch_many([{**patch, "path": path} for path in paths], stop_on_failure=True))
 
     def diff(self) -> str:
         """
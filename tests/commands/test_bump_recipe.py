@@ -15,7 +15,12 @@ from conda_recipe_manager.commands.utils.types import ExitCode
 from conda_recipe_manager.parser.recipe_reader import RecipeReader
 from tests.file_loading import get_test_path, load_file, load_recipe
 from tests.http_mocking import MockHttpStreamResponse
-from tests.smoke_testing import assert_cli_usage
+
+# `CliRunner` holds no state between `invoke()` calls, so a single instance is shared by all tests in this module.
+_RUNNER: Final[CliRunner] = CliRunner()
+# Archive served by `mock_requests_get()` for every mocked artifact URL.
+_MOCK_ARCHIVE_FILE: Final[str] = "archive_files/dummy_project_01.tar.gz"
+_MOCK_ARCHIVE_PATH: Final[Path] = get_test_path() / _MOCK_ARCHIVE_FILE
 
 
 def mock_requests_get(*args: tuple[str], **_: dict[str, str | int]) -> MockHttpStreamResponse:
@@ -56,20 +61,27 @@ def mock_requests_get(*args: tuple[str], **_: dict[str, str | int]) -> MockHttpS
     }
     match endpoint:
         case endpoint if endpoint in default_artifact_set:
-            return MockHttpStreamResponse(200, "archive_files/dummy_project_01.tar.gz")
+            return MockHttpStreamResponse(200, _MOCK_ARCHIVE_FILE)
         # Error cases
         case "https://pypi.io/error_500.html":
-            return MockHttpStreamResponse(500, "archive_files/dummy_project_01.tar.gz")
+            return MockHttpStreamResponse(500, _MOCK_ARCHIVE_FILE)
         case _:
             # TODO fix: pyfakefs does include `/dev/null` by default, but this actually points to `<temp_dir>/dev/null`
             return MockHttpStreamResponse(404, "/dev/null")
 
 
-def test_usage() -> None:
+def _add_test_files(fs: FakeFilesystem, recipe_file_path: Path, *other_file_paths: Path) -> None:
     """
-    Smoke test that ensures rendering of the help menu
+    Maps only the files a test reads into the fake file system, instead of mirroring the whole test files directory.
+    The recipe file that `bump-recipe` edits in place is the only writable file.
+
+    :param fs: `pyfakefs` Fixture used to replace the file system
+    :param recipe_file_path: Path to the recipe file that will be modified
+    :param other_file_paths: Paths to any other files the test reads, like the expected recipe file
     """
-    assert_cli_usage(bump_recipe.bump_recipe)
+    fs.add_real_file(recipe_file_path, read_only=False)
+    for file_path in {_MOCK_ARCHIVE_PATH, *other_file_paths} - {recipe_file_path}:
+        fs.add_real_file(file_path)
 
 
 @pytest.mark.parametrize(
@@ -135,18 +147,16 @@ def test_bump_recipe_cli(
         increment-only mode.
     :param expected_recipe_file: Expected resulting recipe file
     """
-    runner = CliRunner()
-    fs.add_real_directory(get_test_path(), read_only=False)
-
     recipe_file_path: Final[Path] = get_test_path() / recipe_file
     expected_recipe_file_path: Final[Path] = get_test_path() / expected_recipe_file
+    _add_test_files(fs, recipe_file_path, expected_recipe_file_path)
 
     cli_args: Final[list[str]] = (
         ["--build-num", str(recipe_file_path)] if version is None else ["-t", version, str(recipe_file_path)]
     )
 
     with patch("requests.get", new=mock_requests_get):
-        result = runner.invoke(bump_recipe.bump_recipe, cli_args)
+        result = _RUNNER.invoke(bump_recipe.bump_recipe, cli_args)
 
     # Ensure that we don't check against the file that was edited.
     assert recipe_file_path != expected_recipe_file_path
@@ -177,11 +187,10 @@ def test_bump_recipe_http_retry_mechanism(
     :param expected_retries: Expected number of retries that should have been attempted
     """
 
-    runner = CliRunner()
-    fs.add_real_directory(get_test_path(), read_only=False)
     recipe_file_path: Final[Path] = get_test_path() / recipe_file
+    _add_test_files(fs, recipe_file_path)
     with patch("requests.get") as mocker:
-        result = runner.invoke(bump_recipe.bump_recipe, ["-t", version, "-i", "0.01", str(recipe_file_path)])
+        result = _RUNNER.invoke(bump_recipe.bump_recipe, ["-t", version, "-i", "0.01", str(recipe_file_path)])
         assert mocker.call_count == expected_retries
 
     assert result.exit_code == ExitCode.HTTP_ERROR
@@ -191,8 +200,7 @@ def test_bump_recipe_exits_if_target_version_missing() -> None:
     """
     Ensures that the `--target-version` flag is required when `--build-num` is NOT provided.
     """
-    runner = CliRunner()
-    result = runner.invoke(bump_recipe.bump_recipe, [str(get_test_path() / "types-toml.yaml")])
+    result = _RUNNER.invoke(bump_recipe.bump_recipe, [str(get_test_path() / "types-toml.yaml")])
     assert result.exit_code == ExitCode.CLICK_USAGE
 
 
@@ -202,13 +210,11 @@ def test_bump_recipe_increment_build_number_key_missing(fs: FakeFilesystem) -> N
 
     :param fs: `pyfakefs` Fixture used to replace the file system
     """
-    runner = CliRunner()
-    fs.add_real_directory(get_test_path(), read_only=False)
-
     recipe_file_path: Final[Path] = get_test_path() / "bump_recipe/no_build_num.yaml"
     expected_recipe_file_path: Final[Path] = get_test_path() / "bump_recipe/build_num_added.yaml"
+    _add_test_files(fs, recipe_file_path, expected_recipe_file_path)
 
-    result = runner.invoke(bump_recipe.bump_recipe, ["--build-num", str(recipe_file_path)])
+    result = _RUNNER.invoke(bump_recipe.bump_recipe, ["--build-num", str(recipe_file_path)])
 
     # Ensure that we don't check against the file that was edited.
     assert recipe_file_path != expected_recipe_file_path
@@ -224,12 +230,10 @@ def test_bump_recipe_increment_build_number_not_int(fs: FakeFilesystem) -> None:
     :param fs: `pyfakefs` Fixture used to replace the file system
     """
 
-    runner = CliRunner()
-    fs.add_real_directory(get_test_path(), read_only=False)
-
     recipe_file_path: Final[Path] = get_test_path() / "bump_recipe/non_int_build_num.yaml"
+    _add_test_files(fs, recipe_file_path)
 
-    result = runner.invoke(bump_recipe.bump_recipe, ["--build-num", str(recipe_file_path)])
+    result = _RUNNER.invoke(bump_recipe.bump_recipe, ["--build-num", str(recipe_file_path)])
     assert result.exit_code == ExitCode.ILLEGAL_OPERATION
 
 
@@ -241,11 +245,9 @@ def test_bump_recipe_increment_build_num_key_not_found(fs: FakeFilesystem) -> No
     :param fs: `pyfakefs` Fixture used to replace the file system
     """
 
-    runner = CliRunner()
-    fs.add_real_directory(get_test_path(), read_only=False)
-
     recipe_file_path: Final[Path] = get_test_path() / "bump_recipe/no_build_num.yaml"
-    result = runner.invoke(bump_recipe.bump_recipe, ["--build-num", str(recipe_file_path)])
+    _add_test_files(fs, recipe_file_path)
+    result = _RUNNER.invoke(bump_recipe.bump_recipe, ["--build-num", str(recipe_file_path)])
     # TODO: Can't compare directly to `simple-recipe.yaml` as the added key `/build/number` is not canonically sorted to
     # be in the standard position.
     assert load_recipe(recipe_file_path, RecipeReader).get_value("/build/number") == 0
@@ -259,11 +261,9 @@ def test_bump_recipe_increment_no_build_key_found(fs: FakeFilesystem) -> None:
     :param fs: `pyfakefs` Fixture used to replace the file system
     """
 
-    runner = CliRunner()
-    fs.add_real_directory(get_test_path(), read_only=False)
-
     recipe_file_path: Final[Path] = get_test_path() / "bump_recipe/no_build_key.yaml"
-    result = runner.invoke(bump_recipe.bump_recipe, ["--build-num", str(recipe_file_path)])
+    _add_test_files(fs, recipe_file_path)
+    result = _RUNNER.invoke(bump_recipe.bump_recipe, ["--build-num", str(recipe_file_path)])
     assert result.exit_code == ExitCode.ILLEGAL_OPERATION
 
 
@@ -287,15 +287,13 @@ def test_bump_recipe_save_on_failure(
     :param version: Version to bump to
     :param expected_recipe_file: Expected resulting recipe file
     """
-    runner = CliRunner()
-    fs.add_real_directory(get_test_path(), read_only=False)
-
     recipe_file_path: Final[Path] = get_test_path() / recipe_file
     expected_recipe_file_path: Final[Path] = get_test_path() / expected_recipe_file
+    _add_test_files(fs, recipe_file_path, expected_recipe_file_path)
     start_mod_time: Final[float] = recipe_file_path.stat().st_mtime
 
     with patch("requests.get", new=mock_requests_get):
-        result = runner.invoke(
+        result = _RUNNER.invoke(
             bump_recipe.bump_recipe, ["--save-on-failure", "-i", "0.01", "-t", version, str(recipe_file_path)]
         )
 
@@ -0,0 +1,30 @@
+"""
+:Description: Smoke tests the usage/help menus of every `conda-recipe-manager` sub-command
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+import pytest
+from click import Command
+
+from conda_recipe_manager.commands.bump_recipe import bump_recipe
+from conda_recipe_manager.commands.convert import convert
+from conda_recipe_manager.commands.graph import graph
+from conda_recipe_manager.commands.patch import patch
+from conda_recipe_manager.commands.rattler_bulk_build import rattler_bulk_build
+from tests.smoke_testing import assert_cli_usage
+
+# Every sub-command provided by `conda-recipe-manager`
+_COMMANDS: Final[list[Command]] = [bump_recipe, convert, graph, patch, rattler_bulk_build]
+
+
+@pytest.mark.parametrize("command", _COMMANDS, ids=[str(command.name) for command in _COMMANDS])
+def test_usage(command: Command) -> None:
+    """
+    Smoke test that ensures rendering of the help menu
+
+    :param command: The `click` CLI `Command` to test
+    """
+    assert_cli_usage(command)
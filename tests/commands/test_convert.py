@@ -6,14 +6,6 @@ from click.testing import CliRunner
 
 from conda_recipe_manager.commands.convert import convert
 from tests.file_loading import get_test_path, load_file
-from tests.smoke_testing import assert_cli_usage
-
-
-def test_usage() -> None:
-    """
-    Smoke test that ensures rendering of the help menu
-    """
-    assert_cli_usage(convert)
 
 
 def test_only_allow_v0_recipes() -> None:
@@ -2,128 +2,116 @@
 :Description: Tests the `patch` CLI
 """
 
+import shutil
+from pathlib import Path
+from typing import Final, Optional
+
 import pytest
 from click.testing import CliRunner
-from pyfakefs.fake_filesystem import FakeFilesystem
-from pyfakefs.fake_filesystem_unittest import Patcher
 
 from conda_recipe_manager.commands import patch
 from conda_recipe_manager.commands.utils.types import ExitCode
+from tests.constants import JSON_PATCH_FILE, SIMPLE_RECIPE_FILE
 from tests.file_loading import get_test_path
-from tests.smoke_testing import assert_cli_usage
 
+# `CliRunner` holds no state between `invoke()` calls, so a single instance is shared by all tests in this module.
+_RUNNER: Final[CliRunner] = CliRunner()
 
-def test_usage() -> None:
-    """
-    Smoke test that ensures rendering of the help menu
-    """
-    assert_cli_usage(patch.patch)
+# These tests run against the real file system, so it is safe to calculate these paths once.
+_TEST_PATH: Final[Path] = get_test_path()
+_JSON_PATCH_PATH: Final[str] = str(_TEST_PATH / JSON_PATCH_FILE)
 
 
-@pytest.mark.parametrize("json_patch_file", ["patch/json_patch.json", "patch/single_patch.json"])
-def test_patch_cli(json_patch_file: str, fs: FakeFilesystem) -> None:
+def _copy_recipe(recipe_file: str, tmp_path: Path) -> str:
     """
-    Test for the case when both the recipe file and the JSON patch file are in the correct format and read-able.
+    Copies a test recipe file into a temporary directory. The `patch` command writes the recipe file back to disk, so
+    the checked-in test file must not be used directly.
 
-    :param fs: pyfakefs fixture used to replace the file system
+    :param recipe_file: Relative path of the test recipe file to copy
+    :param tmp_path: Temporary directory to copy the recipe file into
+    :returns: Path to the copied recipe file
     """
-    runner = CliRunner()
-    fs.add_real_directory(get_test_path(), read_only=False)
-
-    json_patch_path = get_test_path() / json_patch_file
-    recipe_file_path = get_test_path() / "simple-recipe.yaml"
-
-    result = runner.invoke(patch.patch, [str(json_patch_path), str(recipe_file_path)])
-    assert result.exit_code == ExitCode.SUCCESS
+    return str(shutil.copy(_TEST_PATH / recipe_file, tmp_path))
 
 
-def test_non_existent_recipe_file(fs: FakeFilesystem) -> None:
+@pytest.mark.parametrize("json_patch_file", [JSON_PATCH_FILE, "patch/single_patch.json"])
+def test_patch_cli(json_patch_file: str, tmp_path: Path) -> None:
     """
-    Test for the case when the provided recipe file doesn't exist
+    Test for the case when both the recipe file and the JSON patch file are in the correct format and read-able.
 
-    :param fs: pyfakefs fixture used to replace the file system
+    :param json_patch_file: Relative path of the JSON patch file to apply
+    :param tmp_path: Temporary directory that holds the recipe file being patched
     """
-    runner = CliRunner()
-    fs.add_real_directory(get_test_path(), read_only=False)
+    json_patch_path = _TEST_PATH / json_patch_file
 
-    json_patch_path = get_test_path() / "patch/json_patch.json"
-    recipe_file_path = "non/existent/path"
-
-    result = runner.invoke(patch.patch, [str(json_patch_path), recipe_file_path])
-    assert result.exit_code == ExitCode.CLICK_USAGE
+    result = _RUNNER.invoke(patch.patch, [str(json_patch_path), _copy_recipe(SIMPLE_RECIPE_FILE, tmp_path)])
+    assert result.exit_code == ExitCode.SUCCESS
 
 
-def test_non_existent_json_patch_file(fs: FakeFilesystem) -> None:
+@pytest.mark.parametrize(
+    "json_patch_file_path,recipe_file",
+    [
+        (_JSON_PATCH_PATH, None),
+        ("non/existent/path", SIMPLE_RECIPE_FILE),
+    ],
+)
+def test_non_existent_file(json_patch_file_path: str, recipe_file: Optional[str], tmp_path: Path) -> None:
     """
-    Test for the case when the provided json patch file doesn't exist
+    Test for the case when either the provided recipe file or the provided JSON patch file doesn't exist.
 
-    :param fs: pyfakefs fixture used to replace the file system
+    :param json_patch_file_path: Path to the JSON patch file to provide
+    :param recipe_file: Relative path of the test recipe file to patch. `None` provides a recipe file that doesn't exist
+    :param tmp_path: Temporary directory that holds the recipe file being patched
     """
-    runner = CliRunner()
-    fs.add_real_directory(get_test_path(), read_only=False)
-
-    json_patch_path = "non/existent/path"
-    recipe_file_path = get_test_path() / "simple-recipe.yaml"
-
-    result = runner.invoke(patch.patch, [json_patch_path, str(recipe_file_path)])
+    recipe_file_path: Final[str] = "non/existent/path" if recipe_file is None else _copy_recipe(recipe_file, tmp_path)
+    result = _RUNNER.invoke(patch.patch, [json_patch_file_path, recipe_file_path])
     assert result.exit_code == ExitCode.CLICK_USAGE
 
 
 @pytest.mark.parametrize(
     "recipe_file",
-    ["patch/bad_recipe_files/missing_colon.yaml", "patch/bad_recipe_files/missing_key.yaml"],
+    [
+        pytest.param("patch/bad_recipe_files/missing_colon.yaml", id="missing_colon"),
+        pytest.param("patch/bad_recipe_files/missing_key.yaml", id="missing_key"),
+    ],
 )
-def test_patch_cli_bad_recipe_file(recipe_file: str, fs: FakeFilesystem) -> None:
+def test_patch_cli_bad_recipe_file(recipe_file: str, tmp_path: Path) -> None:
     """
     Test for the case when patch operation fails due to an error in the recipe file,
     for example, due to missing target keys or a missing colon
 
-    :param fs: pyfakefs fixture used to replace the file system
+    :param recipe_file: Relative path of the faulty recipe file to patch
+    :param tmp_path: Temporary directory that holds the recipe file being patched
     """
-    runner = CliRunner()
-    fs.add_real_directory(get_test_path(), read_only=False)
-
-    json_patch_path = get_test_path() / "patch/json_patch.json"
-    bad_recipe_file_path = get_test_path() / recipe_file
-
-    result = runner.invoke(patch.patch, [str(json_patch_path), str(bad_recipe_file_path)])
+    result = _RUNNER.invoke(patch.patch, [_JSON_PATCH_PATH, _copy_recipe(recipe_file, tmp_path)])
     assert result.exit_code == ExitCode.ILLEGAL_OPERATION
 
 
-def test_patch_cli_invalid_json_patch_operation(request: pytest.FixtureRequest) -> None:
+def test_patch_cli_invalid_json_patch_operation(tmp_path: Path) -> None:
     """
     Test for the case when the patch operation fails due to an invalid JSON patch blob
     For example the patch blob might contain invalid patch operations such as `values` instead of `value`.
 
-    :param fs: pyfakefs fixture used to replace the file system
+    :param tmp_path: Temporary directory that holds the recipe file being patched
     """
 
-    runner = CliRunner()
-    request.getfixturevalue("fs").add_real_directory(get_test_path(), read_only=False)  # type: ignore[misc]
+    faulty_json_patch_path = _TEST_PATH / "patch/bad_json_patch_files/bad_json_patch.json"
 
-    faulty_json_patch_path = get_test_path() / "patch/bad_json_patch_files/bad_json_patch.json"
-    recipe_file_path = get_test_path() / "simple-recipe.yaml"
-
-    with Patcher(modules_to_reload=[patch]):  # here patch is the patch.py module
-        result = runner.invoke(patch.patch, [str(faulty_json_patch_path), str(recipe_file_path)])
+    result = _RUNNER.invoke(patch.patch, [str(faulty_json_patch_path), _copy_recipe(SIMPLE_RECIPE_FILE, tmp_path)])
     # this JSON_ERROR comes from JsonPatchValidationException being raised, not from JsonDecodeError
     assert result.exit_code == ExitCode.JSON_ERROR
 
 
-def test_patch_cli_bad_json_file(fs: FakeFilesystem) -> None:
+def test_patch_cli_bad_json_file(tmp_path: Path) -> None:
     """
-    Test for the case when the JSON file cannot be decoded
+    Test for the case when the JSON file cannot be decoded.
 
-    :param fs: pyfakefs fixture used to replace the file system
+    :param tmp_path: Temporary directory that holds the recipe file being patched
     """
 
-    runner = CliRunner()
-    fs.add_real_directory(get_test_path(), read_only=False)
-
-    faulty_json_patch_path = get_test_path() / "patch/bad_json_patch_files/empty_json.json"
-    recipe_file_path = get_test_path() / "simple-recipe.yaml"
+    faulty_json_patch_path = _TEST_PATH / "patch/bad_json_patch_files/empty_json.json"
 
-    result = runner.invoke(patch.patch, [str(faulty_json_patch_path), str(recipe_file_path)])
+    result = _RUNNER.invoke(patch.patch, [str(faulty_json_patch_path), _copy_recipe(SIMPLE_RECIPE_FILE, tmp_path)])
     # this json error comes from `JSONDecodeError` exception occuring when the provided json file cannot be read/decoded
     assert result.exit_code == ExitCode.JSON_ERROR
 
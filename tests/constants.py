@@ -12,3 +12,7 @@ SIMPLE_DESCRIPTION: Final[str] = (
     "It can be used by type-checking tools like mypy, pyright,\n"
     "pytype, PyCharm, etc. to check code that uses toml."
 )
+
+# Test file paths, relative to the `test_aux_files` directory, that are shared by the `patch` CLI tests
+JSON_PATCH_FILE: Final[str] = "patch/json_patch.json"
+SIMPLE_RECIPE_FILE: Final[str] = "simple-recipe.yaml"
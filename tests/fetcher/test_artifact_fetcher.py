@@ -4,54 +4,82 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Final, Type
 
 import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
 
 from conda_recipe_manager.fetcher.artifact_fetcher import from_recipe
 from conda_recipe_manager.fetcher.base_artifact_fetcher import BaseArtifactFetcher
 from conda_recipe_manager.fetcher.exceptions import FetchUnsupportedError
 from conda_recipe_manager.fetcher.git_artifact_fetcher import GitArtifactFetcher
 from conda_recipe_manager.fetcher.http_artifact_fetcher import HttpArtifactFetcher
-from conda_recipe_manager.parser.recipe_reader import RecipeReader
-from tests.file_loading import get_test_path, load_recipe
-
-
-@pytest.mark.parametrize(
-    "file,expected",
-    [
-        ## V0 Format ##
-        ("types-toml.yaml", {"/source": HttpArtifactFetcher}),
-        ("types-toml_src_lst.yaml", {"/source/0": HttpArtifactFetcher}),
-        ("multi-output.yaml", {}),
-        ("git-src.yaml", {"/source": GitArtifactFetcher}),
-        (
-            "cctools-ld64.yaml",
-            {
-                "/source/0": HttpArtifactFetcher,
-                "/source/1": HttpArtifactFetcher,
-                "/source/2": HttpArtifactFetcher,
-                "/source/3": HttpArtifactFetcher,
-            },
-        ),
-        ## V1 Format ##
-        ("v1_format/v1_types-toml.yaml", {"/source": HttpArtifactFetcher}),
-        ("v1_format/v1_types-toml_src_lst.yaml", {"/source/0": HttpArtifactFetcher}),
-        ("v1_format/v1_multi-output.yaml", {}),
-        ("v1_format/v1_git-src.yaml", {"/source": GitArtifactFetcher}),
-        (
-            "v1_format/v1_cctools-ld64.yaml",
-            {
-                "/source/0": HttpArtifactFetcher,
-                "/source/1": HttpArtifactFetcher,
-                "/source/2": HttpArtifactFetcher,
-                "/source/3": HttpArtifactFetcher,
-            },
-        ),
-    ],
-)
+from tests.file_loading import get_test_path, load_recipe_reader
+
+# Only used to source real files for `pyfakefs`, so this is safe to calculate once. See `get_test_path()` for details.
+_TEST_PATH: Final[Path] = get_test_path()
+
+# Recipe files paired with the mapping of source paths to the Artifact Fetcher types expected from `from_recipe()`
+_FROM_RECIPE_CASES: Final[list[tuple[str, dict[str, Type[BaseArtifactFetcher]]]]] = [
+    ## V0 Format ##
+    ("types-toml.yaml", {"/source": HttpArtifactFetcher}),
+    ("types-toml_src_lst.yaml", {"/source/0": HttpArtifactFetcher}),
+    ("multi-output.yaml", {}),
+    ("git-src.yaml", {"/source": GitArtifactFetcher}),
+    (
+        "cctools-ld64.yaml",
+        {
+            "/source/0": HttpArtifactFetcher,
+            "/source/1": HttpArtifactFetcher,
+            "/source/2": HttpArtifactFetcher,
+            "/source/3": HttpArtifactFetcher,
+        },
+    ),
+    ## V1 Format ##
+    ("v1_format/v1_types-toml.yaml", {"/source": HttpArtifactFetcher}),
+    ("v1_format/v1_types-toml_src_lst.yaml", {"/source/0": HttpArtifactFetcher}),
+    ("v1_format/v1_multi-output.yaml", {}),
+    ("v1_format/v1_git-src.yaml", {"/source": GitArtifactFetcher}),
+    (
+        "v1_format/v1_cctools-ld64.yaml",
+        {
+            "/source/0": HttpArtifactFetcher,
+            "/source/1": HttpArtifactFetcher,
+            "/source/2": HttpArtifactFetcher,
+            "/source/3": HttpArtifactFetcher,
+        },
+    ),
+]
+
+# Recipe files containing a source section that cannot be fetched
+_UNSUPPORTED_RECIPE_FILES: Final[list[str]] = [
+    ## V0 Format ##
+    "fake_source.yaml",
+    ## V1 Format ##
+    "v1_format/v1_fake_source.yaml",
+]
+
+
+@pytest.fixture(name="fetcher_fs", scope="module")
+def fixture_fetcher_fs(fs_module: FakeFilesystem) -> FakeFilesystem:
+    """
+    Module-scoped `pyfakefs` test fixture that mirrors every recipe file used in this module in one batch, instead of
+    adding files to a new fake file system on every test. The files are derived from the test case tables.
+
+    :param fs_module: Module-scoped pyfakefs fixture used to replace the file system
+    """
+    # Cases may share recipe files, so each file is only added once.
+    files: Final[set[str]] = {file for file, _ in _FROM_RECIPE_CASES} | set(_UNSUPPORTED_RECIPE_FILES)
+    fs_module.add_real_paths([str(_TEST_PATH / file) for file in sorted(files)])
+    return fs_module
+
+
+@pytest.mark.parametrize("file,expected", _FROM_RECIPE_CASES)
 def test_from_recipe_ignore_unsupported(
-    file: str, expected: dict[str, Type[BaseArtifactFetcher]], request: pytest.FixtureRequest
+    file: str,
+    expected: dict[str, Type[BaseArtifactFetcher]],
+    fetcher_fs: FakeFilesystem,  # pylint: disable=unused-argument
 ) -> None:
     """
     Tests that a list of Artifact Fetchers can be derived from a parsed recipe.
@@ -62,9 +90,9 @@ def test_from_recipe_ignore_unsupported(
 
     :param file: File to work against
     :param expected: Expected mapping of source paths to classes in the returned list.
+    :param fetcher_fs: pyfakefs fixture used to replace the file system
     """
-    request.getfixturevalue("fs").add_real_file(get_test_path() / file)  # type: ignore[misc]
-    recipe = load_recipe(file, RecipeReader)
+    recipe = load_recipe_reader(file)
 
     fetcher_map: Final[dict[str, BaseArtifactFetcher]] = from_recipe(recipe, True)
 
@@ -74,45 +102,33 @@ def test_from_recipe_ignore_unsupported(
         assert isinstance(fetcher_map[key], expected_fetcher_t)
 
 
-@pytest.mark.parametrize(
-    "file",
-    [
-        ## V0 Format ##
-        "fake_source.yaml",
-        ## V1 Format ##
-        "v1_format/v1_fake_source.yaml",
-    ],
-)
-def test_from_recipe_throws_on_unsupported(file: str, request: pytest.FixtureRequest) -> None:
+@pytest.mark.parametrize("file", _UNSUPPORTED_RECIPE_FILES)
+def test_from_recipe_throws_on_unsupported(
+    file: str, fetcher_fs: FakeFilesystem  # pylint: disable=unused-argument
+) -> None:
     """
     Ensures that `from_recipe()` emits the expected exception in the event that a source section cannot be parsed.
 
     :param file: File to work against
+    :param fetcher_fs: pyfakefs fixture used to replace the file system
     """
-    request.getfixturevalue("fs").add_real_file(get_test_path() / file)  # type: ignore[misc]
-    recipe = load_recipe(file, RecipeReader)
+    recipe = load_recipe_reader(file)
 
     with pytest.raises(FetchUnsupportedError):
         from_recipe(recipe)
 
 
-@pytest.mark.parametrize(
-    "file",
-    [
-        ## V0 Format ##
-        "fake_source.yaml",
-        ## V1 Format ##
-        "v1_format/v1_fake_source.yaml",
-    ],
-)
-def test_from_recipe_does_not_throw_on_ignore_unsupported(file: str, request: pytest.FixtureRequest) -> None:
+@pytest.mark.parametrize("file", _UNSUPPORTED_RECIPE_FILES)
+def test_from_recipe_does_not_throw_on_ignore_unsupported(
+    file: str, fetcher_fs: FakeFilesystem  # pylint: disable=unused-argument
+) -> None:
     """
     Ensures that `from_recipe()` DOES NOT emit an exception in the event that a source section cannot be parsed AND the
     `ignore_unsupported` flag is set.
 
     :param file: File to work against
+    :param fetcher_fs: pyfakefs fixture used to replace the file system
     """
-    request.getfixturevalue("fs").add_real_file(get_test_path() / file)  # type: ignore[misc]
-    recipe = load_recipe(file, RecipeReader)
+    recipe = load_recipe_reader(file)
 
     assert not from_recipe(recipe, True)
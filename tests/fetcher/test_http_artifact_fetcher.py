@@ -1,20 +1,20 @@
 """
-:Description: Unit tests for the `HttpArtifactFetcher` class. NOTE: All tests in this file should use `pyfakefs` to
-    prevent writing to disk.
+:Description: Unit tests for the `HttpArtifactFetcher` class. NOTE: All tests in this file redirect the temporary
+    directory used by the fetchers to `tmp_path`, to prevent writing outside of the test's directory.
 """
 
 from __future__ import annotations
 
+import tempfile
+import zipfile
 from pathlib import Path
-from typing import Final, cast
+from typing import Final, NamedTuple, cast
 from unittest.mock import patch
 
 import pytest
-from pyfakefs.fake_filesystem import FakeFilesystem
 
 from conda_recipe_manager.fetcher.exceptions import FetchError, FetchRequiredError
 from conda_recipe_manager.fetcher.http_artifact_fetcher import ArtifactArchiveType, HttpArtifactFetcher
-from tests.file_loading import get_test_path
 from tests.http_mocking import MockHttpStreamResponse
 
 
@@ -33,20 +33,93 @@ class MockUrl:
     HTTP_500: Final[str] = f"{URL_BASE}dummy_failure.zip"
 
 
-@pytest.fixture(name="http_fetcher_p01_tar")
-def fixture_http_fetcher_p01_tar() -> HttpArtifactFetcher:
+class FetchedP01(NamedTuple):
     """
-    `HttpArtifactFetcher` test fixture for a simple tar'd project.
+    Fetched `HttpArtifactFetcher` for the `dummy_project_01` archive, paired with the values expected from it.
     """
-    return HttpArtifactFetcher("dummy_project_01_tar", MockUrl.DUMMY_PROJECT_01_TAR_URL)
 
+    fetcher: HttpArtifactFetcher
+    archive: str
+    sha256: str
+    archive_type: ArtifactArchiveType
 
-@pytest.fixture(name="http_fetcher_p01_zip")
-def fixture_http_fetcher_p01_zip() -> HttpArtifactFetcher:
+
+# Maps mocked URLs to the HTTP status code and the file served by `mock_requests_get()`
+_MOCK_RESPONSES: Final[dict[str, tuple[int, str]]] = {
+    MockUrl.DUMMY_PROJECT_01_TAR_URL: (200, "archive_files/dummy_project_01.tar.gz"),
+    MockUrl.DUMMY_PROJECT_01_ZIP_URL: (200, "archive_files/dummy_project_01.zip"),
+    MockUrl.HTTP_500: (500, "archive_files/dummy_project_01.tar.gz"),
+}
+# Response for any URL not found in `_MOCK_RESPONSES`
+_MOCK_NOT_FOUND_RESPONSE: Final[tuple[int, str]] = (404, "/dev/null")
+
+# Files expected in every variant of the `dummy_project_01` archive
+_P01_FILES: Final[list[str]] = ["homer.py", "README.md"]
+
+
+@pytest.fixture(name="fetcher_temp_dir", autouse=True)
+def fixture_fetcher_temp_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """
+    Redirects the temporary directory used by the Artifact Fetchers to the test's `tmp_path` directory. This runs before
+    any function-scoped `HttpArtifactFetcher` fixture is constructed.
+
+    :param tmp_path: Temporary directory unique to the test
+    :param monkeypatch: Pytest fixture used to patch the `tempfile` module
+    :returns: Temporary directory used by the Artifact Fetchers
+    """
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    return tmp_path
+
+
+def _fetch_once(name: str, archive_url: str, tmp_path_factory: pytest.TempPathFactory) -> HttpArtifactFetcher:
+    """
+    Constructs an `HttpArtifactFetcher` in its own temporary directory and fetches the mocked archive.
+
+    :param name: Name of the artifact to fetch
+    :param archive_url: Mocked URL of the artifact to fetch
+    :param tmp_path_factory: Pytest fixture used to create the temporary directory
+    :returns: An `HttpArtifactFetcher` that has already fetched its archive
+    """
+    with pytest.MonkeyPatch.context() as mp, patch("requests.get", new=mock_requests_get):
+        mp.setattr(tempfile, "tempdir", str(tmp_path_factory.mktemp(name)))
+        http_fetcher = HttpArtifactFetcher(name, archive_url)
+        http_fetcher.fetch()
+    return http_fetcher
+
+
+@pytest.fixture(
+    name="http_fetcher_p01",
+    scope="module",
+    params=[
+        (
+            "dummy_project_01_tar",
+            MockUrl.DUMMY_PROJECT_01_TAR_URL,
+            "dummy_project_01.tar.gz",
+            "e594f5bc141acabe4b0298d05234e80195116667edad3d6a9cd610cab36bc4e1",
+            ArtifactArchiveType.TARBALL,
+        ),
+        (
+            "dummy_project_01_zip",
+            MockUrl.DUMMY_PROJECT_01_ZIP_URL,
+            "dummy_project_01.zip",
+            "7afeff0da0fdd9df4fb14d6b77bbc297e23bb1451dad4530a7241eaf95363067",
+            ArtifactArchiveType.ZIP,
+        ),
+    ],
+    ids=["tar", "zip"],
+)
+def fixture_http_fetcher_p01(request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> FetchedP01:
     """
-    `HttpArtifactFetcher` test fixture for a simple zipped project.
+    `HttpArtifactFetcher` test fixture for a simple project, provided as both a tarball and a zip file. Each archive is
+    fetched once and shared by all tests, so tests must not modify the extracted files.
+
+    :param request: Pytest fixture request object, containing the archive to fetch and the expected results
+    :param tmp_path_factory: Pytest fixture used to create the temporary directory
     """
-    return HttpArtifactFetcher("dummy_project_01_zip", MockUrl.DUMMY_PROJECT_01_ZIP_URL)
+    name, archive_url, archive, sha256, archive_type = cast(
+        tuple[str, str, str, str, ArtifactArchiveType], request.param
+    )
+    return FetchedP01(_fetch_once(name, archive_url, tmp_path_factory), archive, sha256, archive_type)
 
 
 @pytest.fixture(name="http_fetcher_failure")
@@ -66,79 +139,77 @@ def mock_requests_get(*args: tuple[str], **_: dict[str, str | int]) -> MockHttpS
     :param _: Name-specified arguments passed to `requests.get()` (Unused)
     """
     endpoint = cast(str, args[0])
-    match endpoint:
-        case MockUrl.DUMMY_PROJECT_01_TAR_URL:
-            return MockHttpStreamResponse(200, "archive_files/dummy_project_01.tar.gz")
-        case MockUrl.DUMMY_PROJECT_01_ZIP_URL:
-            return MockHttpStreamResponse(200, "archive_files/dummy_project_01.zip")
-        case MockUrl.HTTP_500:
-            return MockHttpStreamResponse(500, "archive_files/dummy_project_01.tar.gz")
-        case _:
-            # TODO fix: pyfakefs does include `/dev/null` by default, but this actually points to `<temp_dir>/dev/null`
-            return MockHttpStreamResponse(404, "/dev/null")
-
-
-@pytest.mark.parametrize(
-    "http_fixture,expected_archive,expected_files",
-    [
-        ("http_fetcher_p01_tar", "dummy_project_01.tar.gz", ["homer.py", "README.md"]),
-        ("http_fetcher_p01_zip", "dummy_project_01.zip", ["homer.py", "README.md"]),
-    ],
-)
-def test_fetch(
-    http_fixture: str, expected_archive: str, expected_files: list[str], request: pytest.FixtureRequest
-) -> None:
-    """
-    Tests fetching and extracting a software archive.
+    status_code, file = _MOCK_RESPONSES.get(endpoint, _MOCK_NOT_FOUND_RESPONSE)
+    return MockHttpStreamResponse(status_code, file)
 
-    :param http_fixture: Name of the target `HttpArtifactFetcher` test fixture
-    :param expected_archive: Expected name of the archive file that is being retrieved
-    :param expected_files: Expected files to be in the extracted archive
-    :param request: Pytest fixture request object.
-    """
-    # Make the test directory accessible to the HTTP mocker
-    request.getfixturevalue("fs").add_real_directory(get_test_path() / "archive_files")  # type: ignore[misc]
 
-    http_fetcher = cast(HttpArtifactFetcher, request.getfixturevalue(http_fixture))
-    with patch("requests.get", new=mock_requests_get):
-        http_fetcher.fetch()
+def test_fetch(http_fetcher_p01: FetchedP01) -> None:
+    """
+    Tests fetching and extracting a software archive. The archive is fetched by the test fixture.
 
+    :param http_fetcher_p01: Fetched `HttpArtifactFetcher` test fixture
+    """
     # Validate the state of the file system. We must use the private path variable as the directory path changes on
     # every run.
-    temp_dir_path: Final[Path] = http_fetcher._temp_dir_path  # pylint: disable=protected-access
+    temp_dir_path: Final[Path] = http_fetcher_p01.fetcher._temp_dir_path  # pylint: disable=protected-access
     assert temp_dir_path.exists()
 
-    assert Path(temp_dir_path / expected_archive).exists()
-    for expected_file in expected_files:
-        assert Path(temp_dir_path / f"extracted_{expected_archive}/{expected_file}").exists()
+    assert Path(temp_dir_path / http_fetcher_p01.archive).exists()
+    for expected_file in _P01_FILES:
+        assert Path(temp_dir_path / f"extracted_{http_fetcher_p01.archive}/{expected_file}").exists()
 
 
-def test_fetch_file_io_failure(
-    fs: FakeFilesystem, http_fetcher_failure: HttpArtifactFetcher  # pylint: disable=unused-argument
-) -> None:
+def test_fetch_zip_many_members(fetcher_temp_dir: Path) -> None:
     """
-    Tests that a file I/O error raises the correct exception.
+    Tests fetching and extracting a zip archive that is large enough to be extracted on multiple threads.
 
-    :param fs: pyfakefs fixture used to replace the file system
-    :param http_fetcher_failure: HttpArtifactFetcher test fixture
+    :param fetcher_temp_dir: Temporary directory used by the Artifact Fetchers
     """
-    # NOTE: We deliberately don't add the test file to the fake file system to force a file error.
+    expected_files: Final[list[str]] = [f"dir_{i % 3}/nested_{i % 2}/file_{i}.txt" for i in range(32)]
+    archive_path: Final[Path] = fetcher_temp_dir / "many_members.zip"
+    with zipfile.ZipFile(archive_path, "w") as zip_file:
+        for file in expected_files:
+            zip_file.writestr(file, f"Contents of {file}")
+
+    http_fetcher: Final[HttpArtifactFetcher] = HttpArtifactFetcher(
+        "many_members", f"{MockUrl.URL_BASE}many_members.zip"
+    )
+
+    def _mock_requests_get(*_: tuple[str], **__: dict[str, str | int]) -> MockHttpStreamResponse:
+        return MockHttpStreamResponse(200, archive_path)
+
+    with patch("requests.get", new=_mock_requests_get):
+        http_fetcher.fetch()
+
+    src_path: Final[Path] = http_fetcher.get_path_to_source_code()
+    for file in expected_files:
+        assert (src_path / file).read_text() == f"Contents of {file}"
+
+
+def test_fetch_file_io_failure() -> None:
+    """
+    Tests that a file I/O error raises the correct exception.
+    """
+    http_fetcher: Final[HttpArtifactFetcher] = HttpArtifactFetcher(
+        "dummy_project_01_tar", MockUrl.DUMMY_PROJECT_01_TAR_URL
+    )
+    # NOTE: We deliberately fail to open the archive file for writing to force a file error.
     with pytest.raises(FetchError) as e:
-        with patch("requests.get", new=mock_requests_get):
-            http_fetcher_failure.fetch()
+        with (
+            patch("requests.get", new=mock_requests_get),
+            patch("conda_recipe_manager.fetcher.http_artifact_fetcher.open", side_effect=PermissionError, create=True),
+        ):
+            http_fetcher.fetch()
 
     assert str(e.value) == "A file system error occurred while fetching the archive."
 
 
-def test_fetch_http_failure(fs: FakeFilesystem, http_fetcher_failure: HttpArtifactFetcher) -> None:
+def test_fetch_http_failure(http_fetcher_failure: HttpArtifactFetcher) -> None:
     """
     Tests that an HTTP error raises the correct exception.
 
-    :param fs: pyfakefs fixture used to replace the file system
     :param http_fetcher_failure: HttpArtifactFetcher test fixture
     """
-    fs.add_real_directory(get_test_path() / "archive_files")
-
     with pytest.raises(FetchError) as e:
         with patch("requests.get", new=mock_requests_get):
             http_fetcher_failure.fetch()
@@ -146,118 +217,59 @@ def test_fetch_http_failure(fs: FakeFilesystem, http_fetcher_failure: HttpArtifa
     assert str(e.value) == "An HTTP error occurred while fetching the archive."
 
 
-@pytest.mark.parametrize(
-    "http_fixture,expected_src",
-    [
-        ("http_fetcher_p01_tar", "extracted_dummy_project_01.tar.gz"),
-        ("http_fetcher_p01_zip", "extracted_dummy_project_01.zip"),
-    ],
-)
-def test_get_path_to_source_code(http_fixture: str, expected_src: str, request: pytest.FixtureRequest) -> None:
+def test_get_path_to_source_code(http_fetcher_p01: FetchedP01) -> None:
     """
     Tests getting the path to the extracted source code.
 
-    :param http_fixture: Name of the target `HttpArtifactFetcher` test fixture
-    :param expected_src: Expected name of the extracted source directory
-    :param request: Pytest fixture request object.
+    :param http_fetcher_p01: Fetched `HttpArtifactFetcher` test fixture
     """
-    # Make the test directory accessible to the HTTP mocker
-    request.getfixturevalue("fs").add_real_directory(get_test_path() / "archive_files")  # type: ignore[misc]
-
-    http_fetcher = cast(HttpArtifactFetcher, request.getfixturevalue(http_fixture))
-    with patch("requests.get", new=mock_requests_get):
-        http_fetcher.fetch()
-
-    src_path: Final[Path] = http_fetcher.get_path_to_source_code()
-    assert str(src_path).endswith(expected_src)
+    src_path: Final[Path] = http_fetcher_p01.fetcher.get_path_to_source_code()
+    assert str(src_path).endswith(f"extracted_{http_fetcher_p01.archive}")
     assert src_path.exists()
 
 
-def test_get_path_to_source_code_raises_no_fetch(
-    fs: FakeFilesystem, http_fetcher_failure: HttpArtifactFetcher  # pylint: disable=unused-argument
-) -> None:
+def test_get_path_to_source_code_raises_no_fetch(http_fetcher_failure: HttpArtifactFetcher) -> None:
     """
     Ensures `get_path_to_source_code()` throws if `fetch()` has not been called.
 
-    :param fs: pyfakefs fixture used to replace the file system
     :param http_fetcher_failure: HttpArtifactFetcher test fixture
     """
     with pytest.raises(FetchRequiredError):
         http_fetcher_failure.get_path_to_source_code()
 
 
-@pytest.mark.parametrize(
-    "http_fixture,expected_hash",
-    [
-        ("http_fetcher_p01_tar", "e594f5bc141acabe4b0298d05234e80195116667edad3d6a9cd610cab36bc4e1"),
-        ("http_fetcher_p01_zip", "7afeff0da0fdd9df4fb14d6b77bbc297e23bb1451dad4530a7241eaf95363067"),
-    ],
-)
-def test_get_archive_sha256(http_fixture: str, expected_hash: str, request: pytest.FixtureRequest) -> None:
+def test_get_archive_sha256(http_fetcher_p01: FetchedP01) -> None:
     """
     Tests calculating the SHA-256 hash of the downloaded archive file.
 
-    :param http_fixture: Name of the target `HttpArtifactFetcher` test fixture
-    :param expected_hash: Expected hash of the archive file
-    :param request: Pytest fixture request object.
+    :param http_fetcher_p01: Fetched `HttpArtifactFetcher` test fixture
     """
-    # Make the test directory accessible to the HTTP mocker
-    request.getfixturevalue("fs").add_real_directory(get_test_path() / "archive_files")  # type: ignore[misc]
-
-    http_fetcher = cast(HttpArtifactFetcher, request.getfixturevalue(http_fixture))
-    with patch("requests.get", new=mock_requests_get):
-        http_fetcher.fetch()
+    assert http_fetcher_p01.fetcher.get_archive_sha256() == http_fetcher_p01.sha256
 
-    assert http_fetcher.get_archive_sha256() == expected_hash
 
-
-def test_get_archive_sha256_raises_no_fetch(
-    fs: FakeFilesystem, http_fetcher_failure: HttpArtifactFetcher  # pylint: disable=unused-argument
-) -> None:
+def test_get_archive_sha256_raises_no_fetch(http_fetcher_failure: HttpArtifactFetcher) -> None:
     """
     Ensures `get_archive_sha256()` throws if `fetch()` has not been called.
 
-    :param fs: pyfakefs fixture used to replace the file system
     :param http_fetcher_failure: HttpArtifactFetcher test fixture
     """
     with pytest.raises(FetchRequiredError):
         http_fetcher_failure.get_archive_sha256()
 
 
-@pytest.mark.parametrize(
-    "http_fixture,expected_type",
-    [
-        ("http_fetcher_p01_tar", ArtifactArchiveType.TARBALL),
-        ("http_fetcher_p01_zip", ArtifactArchiveType.ZIP),
-    ],
-)
-def test_get_archive_type(
-    http_fixture: str, expected_type: ArtifactArchiveType, request: pytest.FixtureRequest
-) -> None:
+def test_get_archive_type(http_fetcher_p01: FetchedP01) -> None:
     """
     Tests getting the archive type of the downloaded archive file.
 
-    :param http_fixture: Name of the target `HttpArtifactFetcher` test fixture
-    :param expected_type: Expected type of the archive file
-    :param request: Pytest fixture request object.
+    :param http_fetcher_p01: Fetched `HttpArtifactFetcher` test fixture
     """
-    # Make the test directory accessible to the HTTP mocker
-    request.getfixturevalue("fs").add_real_directory(get_test_path() / "archive_files")  # type: ignore[misc]
-
-    http_fetcher = cast(HttpArtifactFetcher, request.getfixturevalue(http_fixture))
-    with patch("requests.get", new=mock_requests_get):
-        http_fetcher.fetch()
-
-    assert http_fetcher.get_archive_type() == expected_type
+    assert http_fetcher_p01.fetcher.get_archive_type() == http_fetcher_p01.archive_type
 
 
-def test_get_archive_type_raises_no_fetch(
-    fs: FakeFilesystem, http_fetcher_failure: HttpArtifactFetcher  # pylint: disable=unused-argument
-) -> None:
+def test_get_archive_type_raises_no_fetch(http_fetcher_failure: HttpArtifactFetcher) -> None:
     """
     Ensures `get_archive_type()` throws if `fetch()` has not been called.
 
-    :param fs: pyfakefs fixture used to replace the file system
     :param http_fetcher_failure: HttpArtifactFetcher test fixture
     """
     with pytest.raises(FetchRequiredError):
@@ -4,22 +4,26 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 from pathlib import Path
-from typing import Final, Type, TypeVar, cast
+from typing import TYPE_CHECKING, Final, Type, TypeVar, cast
 
-from conda_recipe_manager.grapher.recipe_graph import RecipeGraph
-from conda_recipe_manager.parser.cbc_parser import CbcParser
-from conda_recipe_manager.parser.recipe_reader import RecipeReader
-from conda_recipe_manager.parser.recipe_reader_deps import RecipeReaderDeps
-from conda_recipe_manager.types import JsonType
+# The parsing modules pull in the YAML and Jinja infrastructure, so they are only imported by the functions that use
+# them. Tests that only need to read files (like `load_file()`) do not pay for those imports.
+if TYPE_CHECKING:
+    from conda_recipe_manager.grapher.recipe_graph import RecipeGraph
+    from conda_recipe_manager.parser.cbc_parser import CbcParser
+    from conda_recipe_manager.parser.recipe_reader import RecipeReader
+    from conda_recipe_manager.parser.recipe_reader_deps import RecipeReaderDeps
+    from conda_recipe_manager.types import JsonType
 
 # Private string, calculated once, containing the path to the test files.
 _TEST_FILES_PATH_STR: Final[str] = f"{os.path.dirname(__file__)}/test_aux_files"
 
 # Generic Type for recipe-parsing classes
-R = TypeVar("R", bound=RecipeReader)
+R = TypeVar("R", bound="RecipeReader")
 
 
 def get_test_path() -> Path:
@@ -38,15 +42,43 @@ def get_test_path() -> Path:
     return Path(_TEST_FILES_PATH_STR)
 
 
+@functools.cache  # type: ignore[misc]
+def _read_text(file: str, mtime_ns: int, size: int) -> str:  # pylint: disable=unused-argument
+    """
+    Reads a text file, caching the results. The modification time and size of the file are part of the cache key, so
+    that files edited by a test (in `pyfakefs` or otherwise) are read again.
+
+    :param file: Path of the file to read
+    :param mtime_ns: Modification time of the file, in nanoseconds
+    :param size: Size of the file, in bytes
+    :returns: Text from the file
+    """
+    # Test files are small, so the file is read with as few low-level `os.read()` calls as possible, instead of going
+    # through the buffered text I/O stack.
+    chunks: list[bytes] = []
+    fd: Final[int] = os.open(file, os.O_RDONLY)
+    try:
+        # Read one byte past the expected size, so that a file that grew since it was stat'd is still fully read.
+        while chunk := os.read(fd, size + 1):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    # Match the universal newline handling of text mode.
+    return b"".join(chunks).decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
 def load_file(file: Path | str) -> str:
     """
     Loads a file into a single string. Assumes the file is under the `TEST_FILES_PATH` directory, which is the standard
-    location for all testing files.
+    location for all testing files. Unchanged files are only read from disk once.
 
     :param file: Filename/relative path of the file to read
     :returns: Text from the file
     """
-    return (get_test_path() / file).read_text(encoding="utf-8")
+    # `os.path.join()` avoids constructing a `Path` on every call. Like the `/` operator, it keeps absolute paths as-is.
+    path: Final[str] = os.path.join(_TEST_FILES_PATH_STR, file)
+    file_stat: Final[os.stat_result] = os.stat(path)
+    return _read_text(path, file_stat.st_mtime_ns, file_stat.st_size)
 
 
 def load_recipe(file_name: Path | str, recipe_parser: Type[R]) -> R:
@@ -60,13 +92,49 @@ def load_recipe(file_name: Path | str, recipe_parser: Type[R]) -> R:
     return recipe_parser(recipe)
 
 
+@functools.cache  # type: ignore[misc]
+def load_recipe_reader(file_name: str) -> RecipeReader:
+    """
+    Cached variant of `load_recipe()` for tests that only read from a recipe. Each file is parsed once per test session,
+    so the returned `RecipeReader` instance is shared between tests. `RecipeReader` offers no editing tools, so sharing
+    is safe as long as callers do not reach into private state.
+
+    :param file_name: File name of the test recipe to load
+    :returns: RecipeReader instance, based on the file
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from conda_recipe_manager.parser.recipe_reader import RecipeReader
+
+    return load_recipe(file_name, RecipeReader)
+
+
 def load_recipe_graph(recipes: list[str]) -> RecipeGraph:
     """
     Loads a series of recipe files into a graph.
 
+    Each list of recipes is only loaded once per test session, so the returned `RecipeGraph` instance is shared between
+    tests. Callers must not modify the graph.
+
     :param recipes: List of recipe test files
     :returns: RecipeParser graph consisting of the recipes provided
     """
+    return _load_recipe_graph(tuple(recipes))
+
+
+@functools.cache  # type: ignore[misc]
+def _load_recipe_graph(recipes: tuple[str, ...]) -> RecipeGraph:
+    """
+    Cached implementation of `load_recipe_graph()`. Lists are not hashable, so the recipes are provided as a tuple.
+
+    :param recipes: Recipe test files
+    :returns: RecipeParser graph consisting of the recipes provided
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from conda_recipe_manager.grapher.recipe_graph import RecipeGraph
+
+    # pylint: disable-next=import-outside-toplevel
+    from conda_recipe_manager.parser.recipe_reader_deps import RecipeReaderDeps
+
     tbl: dict[str, RecipeReaderDeps] = {}
     failed: set[str] = set()
     for recipe in recipes:
@@ -86,10 +154,25 @@ def load_cbc(file_name: Path | str) -> CbcParser:
     :param file_name: File name of the test CBC file to load
     :returns: RecipeParser instance, based on the file
     """
-    cbc: Final[str] = load_file(get_test_path() / "cbc_files" / file_name)
+    # pylint: disable-next=import-outside-toplevel
+    from conda_recipe_manager.parser.cbc_parser import CbcParser
+
+    cbc: Final[str] = load_file(os.path.join("cbc_files", file_name))
     return CbcParser(cbc)
 
 
+@functools.cache  # type: ignore[misc]
+def load_cbc_reader(file_name: str) -> CbcParser:
+    """
+    Cached variant of `load_cbc()` for tests that only query a CBC file. Each file is parsed once per test session, so
+    the returned `CbcParser` instance is shared between tests. Callers must not modify the parser.
+
+    :param file_name: File name of the test CBC file to load
+    :returns: CbcParser instance, based on the file
+    """
+    return load_cbc(file_name)
+
+
 def load_json_file(file: Path | str) -> JsonType:
     """
     Loads JSON from a test file.
@@ -97,4 +180,4 @@ def load_json_file(file: Path | str) -> JsonType:
     :param file_name: File name of the JSON file to load
     :returns: Parsed JSON read from the file
     """
-    return cast(JsonType, json.loads(load_file(file)))
+    return cast("JsonType", json.loads(load_file(file)))
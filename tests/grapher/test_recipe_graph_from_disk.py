@@ -7,20 +7,32 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Final
 
+import pytest
+
 from conda_recipe_manager.grapher.recipe_graph_from_disk import RecipeGraphFromDisk
 from tests.file_loading import get_test_path
 
 
-def test_construct_rg_from_disk() -> None:
+@pytest.fixture(name="rg_from_disk", scope="module")
+def fixture_rg_from_disk() -> RecipeGraphFromDisk:
     """
-    Simple smoke test that validates constructing a RecipeGraphFromDisk object from a small test directory
+    Module-scoped RecipeGraphFromDisk test fixture, constructed from a small test directory. The graph is only queried,
+    so one instance is shared by every test in this module.
+
+    :returns: RecipeGraphFromDisk instance
     """
     path: Final[Path] = get_test_path() / "rg_from_disk_test"
     # Using all available CPUs WHILE running tests with xdist causes some stability issues. When running tests,
     # pytest-cov will report coverage file corruption AND this test will hang for a few seconds.
-    rg = RecipeGraphFromDisk(path, cpu_count=1)
-    assert rg.contains_package_name("boto")
-    assert rg.contains_package_name("types-toml")
-    assert rg.contains_package_name("cctools")
-    assert rg.contains_package_name("ld64")
-    assert rg.contains_package_name("git-src")
+    return RecipeGraphFromDisk(path, cpu_count=1)
+
+
+@pytest.mark.parametrize("package", ["boto", "types-toml", "cctools", "ld64", "git-src"])
+def test_construct_rg_from_disk(rg_from_disk: RecipeGraphFromDisk, package: str) -> None:
+    """
+    Simple smoke test that validates constructing a RecipeGraphFromDisk object from a small test directory
+
+    :param rg_from_disk: RecipeGraphFromDisk test fixture
+    :param package: Name of a package that should be found in the graph
+    """
+    assert rg_from_disk.contains_package_name(package)
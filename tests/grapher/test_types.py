@@ -9,6 +9,7 @@ import json
 import pytest
 
 from conda_recipe_manager.grapher.types import PackageStats, PackageStatsEncoder
+from conda_recipe_manager.types import JsonType
 
 
 @pytest.mark.parametrize(
@@ -16,25 +17,25 @@ from conda_recipe_manager.grapher.types import PackageStats, PackageStatsEncoder
     [
         (
             PackageStats(),
-            (
-                '{"package_name_duplicates": [],'
-                ' "recipes_failed_to_parse": [],'
-                ' "recipes_failed_to_parse_dependencies": {},'
-                ' "total_parsed_recipes": 0,'
-                ' "total_recipes": 0,'
-                ' "total_packages": 0}'
-            ),
+            {
+                "package_name_duplicates": [],
+                "recipes_failed_to_parse": [],
+                "recipes_failed_to_parse_dependencies": {},
+                "total_parsed_recipes": 0,
+                "total_recipes": 0,
+                "total_packages": 0,
+            },
         ),
         (
             PackageStats(total_packages=50, total_parsed_recipes=20, total_recipes=25),
-            (
-                '{"package_name_duplicates": [],'
-                ' "recipes_failed_to_parse": [],'
-                ' "recipes_failed_to_parse_dependencies": {},'
-                ' "total_parsed_recipes": 20,'
-                ' "total_recipes": 25,'
-                ' "total_packages": 50}'
-            ),
+            {
+                "package_name_duplicates": [],
+                "recipes_failed_to_parse": [],
+                "recipes_failed_to_parse_dependencies": {},
+                "total_parsed_recipes": 20,
+                "total_recipes": 25,
+                "total_packages": 50,
+            },
         ),
         (
             PackageStats(
@@ -45,19 +46,24 @@ from conda_recipe_manager.grapher.types import PackageStats, PackageStatsEncoder
                 total_parsed_recipes=20,
                 total_recipes=25,
             ),
-            (
-                '{"package_name_duplicates": ["foobar"],'
-                ' "recipes_failed_to_parse": ["bar", "foo"],'
-                ' "recipes_failed_to_parse_dependencies": {"charlie": ["tango", "bravo"]},'
-                ' "total_parsed_recipes": 20,'
-                ' "total_recipes": 25,'
-                ' "total_packages": 42}'
-            ),
+            {
+                "package_name_duplicates": ["foobar"],
+                # Sets are encoded as sorted lists
+                "recipes_failed_to_parse": ["bar", "foo"],
+                "recipes_failed_to_parse_dependencies": {"charlie": ["tango", "bravo"]},
+                "total_parsed_recipes": 20,
+                "total_recipes": 25,
+                "total_packages": 42,
+            },
         ),
     ],
 )
-def test_package_stats_json_endcoding(stats: PackageStats, expected: str) -> None:
+def test_package_stats_json_endcoding(stats: PackageStats, expected: JsonType) -> None:
     """
-    Validates serializing PackageStats to JSON
+    Validates serializing PackageStats to JSON. The encoded JSON is parsed back before comparing, so the test does not
+    depend on the encoder's whitespace or key order.
+
+    :param stats: Package statistics to encode
+    :param expected: Expected JSON data, after decoding
     """
-    assert json.dumps(stats, cls=PackageStatsEncoder) == expected  # type: ignore[misc]
+    assert json.loads(json.dumps(stats, cls=PackageStatsEncoder)) == expected  # type: ignore[misc]
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Iterable
 
@@ -13,6 +14,18 @@ from conda_recipe_manager.types import JsonType, SentinelType
 from tests.file_loading import get_test_path, load_file, load_json_file
 
 
+@functools.cache  # type: ignore[misc]
+def _load_stream_file(file: Path | str) -> bytes:
+    """
+    Reads the contents of a file streamed by `MockHttpStreamResponse`. Test archives are small and never change, so
+    each file is only read once per test session.
+
+    :param file: Path to the file to read, relative to the test files directory
+    :returns: Raw contents of the file
+    """
+    return (get_test_path() / file).read_bytes()
+
+
 class MockHttpResponse:
     """
     Class that mocks a basic HTTP response.
@@ -107,29 +120,28 @@ class MockHttpStreamResponse(MockHttpResponse):
         """
         Constructs a mocked HTTP response that streams data.
 
-        NOTE: `fs.add_real_directory()` must be called before this mocker is used in order to ensure
-        the file is available to the fake file system.
+        NOTE: When using `pyfakefs`, the file must be added to the fake file system before this mocker is used (e.g.
+        with `fs.add_real_file()`). The file contents are cached after the first read.
 
         :param status_code: HTTP status code to return
         :param file: Path to file to load data from.
         :param content_type: (Optional) `content-type` header string
         """
         super().__init__(status_code, content_type)
-        self._file_obj = open(get_test_path() / file, "rb")  # pylint: disable=consider-using-with
-
-        # Mock `iter_content()` by passing the buck to `read()`
-        def _mock_iter_content(chunk_size: int) -> Iterable[bytes]:
-            # Simulate an exception if a non-200 error code is provided
-            if self.status_code // 100 != 2:
-                raise requests.exceptions.ConnectionError("Simulated failure!")
-            yield self._file_obj.read(chunk_size)
+        # The file must still be reachable on every request, so that tests can simulate missing files with `pyfakefs`.
+        (get_test_path() / file).stat()
+        self._data = memoryview(_load_stream_file(file))
 
-        self.iter_content = _mock_iter_content
-
-    def __del__(self) -> None:
+    def iter_content(self, chunk_size: int) -> Iterable[memoryview]:
         """
-        Destructor for the HTTP mocker. Cleans up file pointer to test file.
+        Mocked function call that streams the file contents as zero-copy chunks of the cached file data.
+
+        :param chunk_size: Maximum size of each chunk, in bytes
+        :raises ConnectionError: If the mocked response does not have a 2XX status code
+        :returns: Chunks of the file contents
         """
-        # `_file_obj` may not exist if `open()` threw an exception.
-        if hasattr(self, "_file_obj"):
-            self._file_obj.close()
+        # Simulate an exception if a non-200 error code is provided
+        if self.status_code // 100 != 2:
+            raise requests.exceptions.ConnectionError("Simulated failure!")
+        for i in range(0, len(self._data), chunk_size):
+            yield self._data[i : i + chunk_size]
@@ -9,6 +9,17 @@ import pytest
 from conda_recipe_manager.licenses.spdx_utils import SpdxUtils
 
 
+@pytest.fixture(name="spdx_utils", scope="module")
+def fixture_spdx_utils() -> SpdxUtils:
+    """
+    Module-scoped `SpdxUtils` test fixture. Loading the SPDX license database is expensive and license matching does
+    not modify the instance, so one instance is shared by every test in this module.
+
+    :returns: `SpdxUtils` instance
+    """
+    return SpdxUtils()
+
+
 @pytest.mark.parametrize(
     "license_field,expected",
     [
@@ -28,12 +39,14 @@ from conda_recipe_manager.licenses.spdx_utils import SpdxUtils
         ('BSD 2-Clause "SIMPLIFIED"', "BSD-2-Clause"),
     ],
 )
-def test_find_closest_license_match_common_misuse(license_field: str, expected: str) -> None:
+def test_find_closest_license_match_common_misuse(spdx_utils: SpdxUtils, license_field: str, expected: str) -> None:
     """
     Validates license matching with commonly used incorrect license names
+
+    :param spdx_utils: `SpdxUtils` test fixture
+    :param license_field: License string to match
+    :param expected: Expected SPDX identifier
     """
-    # TODO fixture
-    spdx_utils = SpdxUtils()
     assert spdx_utils.find_closest_license_match(license_field) == expected
 
 
@@ -45,10 +58,11 @@ def test_find_closest_license_match_common_misuse(license_field: str, expected:
         "fadsjkl;adshbfjkasd",
     ],
 )
-def test_find_closest_license_match_failed_to_find_match(license_field: str) -> None:
+def test_find_closest_license_match_failed_to_find_match(spdx_utils: SpdxUtils, license_field: str) -> None:
     """
     Validates that the license matcher returns `None` on very far-off inputs
+
+    :param spdx_utils: `SpdxUtils` test fixture
+    :param license_field: License string to match
     """
-    # TODO fixture
-    spdx_utils = SpdxUtils()
     assert spdx_utils.find_closest_license_match(license_field) is None
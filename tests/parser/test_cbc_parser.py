@@ -7,7 +7,7 @@ import pytest
 from conda_recipe_manager.parser.platform_types import Platform
 from conda_recipe_manager.parser.selector_query import SelectorQuery
 from conda_recipe_manager.types import Primitives
-from tests.file_loading import load_cbc
+from tests.file_loading import load_cbc, load_cbc_reader
 
 
 @pytest.mark.parametrize(
@@ -47,7 +47,7 @@ def test_contains(file: str, variable: str, expected: bool) -> None:
     :param variable: Target variable name
     :param expected: Expected result of the test
     """
-    parser = load_cbc(file)
+    parser = load_cbc_reader(file)
     assert (variable in parser) == expected
 
 
@@ -158,7 +158,7 @@ def test_list_cbc_variables(file: str, expected: list[str]) -> None:
     :param file: File to test against
     :param expected: Expected result of the test
     """
-    parser = load_cbc(file)
+    parser = load_cbc_reader(file)
     assert parser.list_cbc_variables() == expected
 
 
@@ -182,7 +182,7 @@ def test_get_cbc_variable_value(file: str, variable: str, query: SelectorQuery,
     :param query: Target selector query
     :param expected: Expected result of the test
     """
-    parser = load_cbc(file)
+    parser = load_cbc_reader(file)
     assert parser.get_cbc_variable_value(variable, query) == expected
 
 
@@ -203,7 +203,7 @@ def test_get_cbc_variable_raises(file: str, variable: str, query: SelectorQuery,
     :param query: Target selector query
     :param exception: Exception expected to be raised
     """
-    parser = load_cbc(file)
+    parser = load_cbc_reader(file)
     with pytest.raises(exception):  # type: ignore
         parser.get_cbc_variable_value(variable, query)
 
@@ -230,5 +230,5 @@ def test_get_cbc_variable_value_with_default(
     :param default: Default value to use if the value could not be found
     :param expected: Expected result of the test
     """
-    parser = load_cbc(file)
+    parser = load_cbc_reader(file)
     assert parser.get_cbc_variable_value(variable, query, default) == expected
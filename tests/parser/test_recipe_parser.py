@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+import re
+
 import pytest
 
 from conda_recipe_manager.parser.enums import SelectorConflictMode
@@ -11,7 +13,7 @@ from conda_recipe_manager.parser.exceptions import JsonPatchValidationException
 from conda_recipe_manager.parser.recipe_parser import RecipeParser
 from conda_recipe_manager.parser.selector_parser import SelectorParser
 from conda_recipe_manager.parser.types import SchemaVersion
-from conda_recipe_manager.types import JsonType
+from conda_recipe_manager.types import JsonPatchType, JsonType
 from tests.constants import SIMPLE_DESCRIPTION
 from tests.file_loading import load_file, load_recipe
 
@@ -224,561 +226,332 @@ def test_add_comment_raises(file: str, path: str, comment: str, exception: BaseE
 ## Patch and Search ##
 
 
-def test_patch_schema_validation() -> None:
+@pytest.fixture(name="schema_validation_parser", scope="module")
+def fixture_schema_validation_parser() -> RecipeParser:
+    """
+    Module-scoped `RecipeParser` test fixture for patches that fail JSON patch schema validation. Validation happens
+    before the parse tree is touched, so one parser is shared by all of these cases.
+
+    :returns: `RecipeParser` instance, based on `simple-recipe.yaml`
+    """
+    return load_recipe("simple-recipe.yaml", RecipeParser)
+
+
+@pytest.mark.parametrize(
+    "patch",
+    [
+        # Invalid enum/unknown op
+        pytest.param({"op": "fakeop", "path": "/build/number", "value": 42}, id="unknown-op"),
+        pytest.param({"op": "", "path": "/build/number", "value": 42}, id="empty-op"),
+        # Patch has extra field(s)
+        pytest.param({"op": "replace", "path": "/build/number", "value": 42, "extra": "field"}, id="extra-field"),
+        # Patch is missing required fields
+        pytest.param({"path": "/build/number", "value": 42}, id="missing-op"),
+        pytest.param({"op": "replace", "value": 42}, id="missing-path"),
+        # Passing an empty path fails at this layer, so it applies to all patch functions.
+        pytest.param({"op": "test", "path": "", "value": 42}, id="empty-path"),
+        # Patch is missing required fields, based on `op`
+        pytest.param({"op": "add", "path": "/build/number"}, id="add-missing-value"),
+        pytest.param({"op": "replace", "path": "/build/number"}, id="replace-missing-value"),
+        pytest.param({"op": "move", "path": "/build/number"}, id="move-missing-from"),
+        pytest.param({"op": "copy", "path": "/build/number"}, id="copy-missing-from"),
+        pytest.param({"op": "test", "path": "/build/number"}, id="test-missing-value"),
+        # Patch has invalid types in critical fields
+        pytest.param({"op": "move", "path": 42, "value": 42}, id="non-string-path"),
+        pytest.param({"op": "move", "path": "/build/number", "from": 42}, id="non-string-from"),
+    ],
+)
+def test_patch_schema_validation(schema_validation_parser: RecipeParser, patch: JsonPatchType) -> None:
     """
     Tests edge cases that should trigger an exception on JSON patch schema validation. Valid schemas are inherently
     tested in the other patching tests.
+
+    :param schema_validation_parser: Shared `RecipeParser` test fixture
+    :param patch: JSON patch that fails schema validation
     """
-    parser = load_recipe("simple-recipe.yaml", RecipeParser)
-    # Invalid enum/unknown op
-    with pytest.raises(JsonPatchValidationException):
-        parser.patch(
-            {
-                "op": "fakeop",
-                "path": "/build/number",
-                "value": 42,
-            }
-        )
-    with pytest.raises(JsonPatchValidationException):
-        parser.patch(
-            {
-                "op": "",
-                "path": "/build/number",
-                "value": 42,
-            }
-        )
-    # Patch has extra field(s)
-    with pytest.raises(JsonPatchValidationException):
-        parser.patch(
-            {
-                "op": "replace",
-                "path": "/build/number",
-                "value": 42,
-                "extra": "field",
-            }
-        )
-    # Patch is missing required fields
-    with pytest.raises(JsonPatchValidationException):
-        parser.patch(
-            {
-                "path": "/build/number",
-                "value": 42,
-            }
-        )
-    with pytest.raises(JsonPatchValidationException):
-        parser.patch(
-            {
-                "op": "replace",
-                "value": 42,
-            }
-        )
-    # Patch is missing required fields, based on `op`
-    with pytest.raises(JsonPatchValidationException):
-        parser.patch(
-            {
-                "op": "add",
-                "path": "/build/number",
-            }
-        )
-    with pytest.raises(JsonPatchValidationException):
-        parser.patch(
-            {
-                "op": "replace",
-                "path": "/build/number",
-            }
-        )
-    with pytest.raises(JsonPatchValidationException):
-        parser.patch(
-            {
-                "op": "move",
-                "path": "/build/number",
-            }
-        )
     with pytest.raises(JsonPatchValidationException):
-        parser.patch(
-            {
-                "op": "copy",
-                "path": "/build/number",
-            }
-        )
-    with pytest.raises(JsonPatchValidationException):
-        parser.patch(
-            {
-                "op": "test",
-                "path": "/build/number",
-            }
-        )
-    # Patch has invalid types in critical fields
-    with pytest.raises(JsonPatchValidationException):
-        parser.patch({"op": "move", "path": 42, "value": 42})
-    with pytest.raises(JsonPatchValidationException):
-        parser.patch({"op": "move", "path": "/build/number", "from": 42})
+        schema_validation_parser.patch(patch)
+    # The shared parser must never be modified by a patch that fails validation.
+    assert not schema_validation_parser.is_modified()
+
+
+@pytest.fixture(name="invalid_path_parser", scope="module")
+def fixture_invalid_path_parser() -> RecipeParser:
+    """
+    Module-scoped `RecipeParser` test fixture for patches that target paths that do not exist. These patches fail
+    without touching the parse tree, so one parser is shared by all of these cases.
+
+    :returns: `RecipeParser` instance, based on `simple-recipe.yaml`
+    """
+    return load_recipe("simple-recipe.yaml", RecipeParser)
 
 
-def test_patch_path_invalid() -> None:
+@pytest.mark.parametrize(
+    "patch",
+    [
+        # add
+        pytest.param({"op": "add", "path": "/package/path/to/fake/value", "value": 42}, id="add-fake-path"),
+        pytest.param({"op": "add", "path": "/build/number/0", "value": 42}, id="add-scalar-index"),
+        pytest.param({"op": "add", "path": "/multi_level/list2/4", "value": 42}, id="add-index-out-of-range"),
+        # remove
+        pytest.param({"op": "remove", "path": "/package/path/to/fake/value"}, id="remove-fake-path"),
+        pytest.param({"op": "remove", "path": "/build/number/0"}, id="remove-scalar-index"),
+        pytest.param({"op": "remove", "path": "/multi_level/list2/4"}, id="remove-index-out-of-range"),
+        pytest.param({"op": "remove", "path": "/build/skip/true"}, id="remove-scalar-key"),
+        # replace
+        pytest.param({"op": "replace", "path": "/build/number/0", "value": 42}, id="replace-scalar-index"),
+        pytest.param({"op": "replace", "path": "/multi_level/list2/4", "value": 42}, id="replace-index-out-of-range"),
+        pytest.param({"op": "replace", "path": "/build/skip/true", "value": 42}, id="replace-scalar-key"),
+        pytest.param({"op": "replace", "path": "/package/path/to/fake/value", "value": 42}, id="replace-fake-path"),
+        # move, `path` is invalid
+        pytest.param(
+            {"op": "move", "path": "/package/path/to/fake/value", "from": "/about/summary"}, id="move-fake-path"
+        ),
+        pytest.param({"op": "move", "path": "/build/number/0", "from": "/about/summary"}, id="move-scalar-index"),
+        pytest.param(
+            {"op": "move", "path": "/multi_level/list2/4", "from": "/about/summary"}, id="move-index-out-of-range"
+        ),
+        # move, `from` is invalid
+        pytest.param(
+            {"op": "move", "from": "/package/path/to/fake/value", "path": "/about/summary"}, id="move-fake-from"
+        ),
+        pytest.param({"op": "move", "from": "/build/number/0", "path": "/about/summary"}, id="move-scalar-index-from"),
+        pytest.param(
+            {"op": "move", "from": "/multi_level/list2/4", "path": "/about/summary"}, id="move-index-out-of-range-from"
+        ),
+        # copy, `path` is invalid
+        pytest.param(
+            {"op": "copy", "path": "/package/path/to/fake/value", "from": "/about/summary"}, id="copy-fake-path"
+        ),
+        pytest.param({"op": "copy", "path": "/build/number/0", "from": "/about/summary"}, id="copy-scalar-index"),
+        pytest.param(
+            {"op": "copy", "path": "/multi_level/list2/4", "from": "/about/summary"}, id="copy-index-out-of-range"
+        ),
+        # copy, `from` is invalid
+        pytest.param(
+            {"op": "copy", "from": "/package/path/to/fake/value", "path": "/about/summary"}, id="copy-fake-from"
+        ),
+        pytest.param({"op": "copy", "from": "/build/number/0", "path": "/about/summary"}, id="copy-scalar-index-from"),
+        pytest.param(
+            {"op": "copy", "from": "/multi_level/list2/4", "path": "/about/summary"}, id="copy-index-out-of-range-from"
+        ),
+        # test
+        pytest.param({"op": "test", "path": "/package/path/to/fake/value", "value": 42}, id="test-fake-path"),
+    ],
+)
+def test_patch_path_invalid(invalid_path_parser: RecipeParser, patch: JsonPatchType) -> None:
     """
     Tests if `patch` returns false on all ops when the path is not found. Also checks if the tree has been modified.
+
+    :param invalid_path_parser: Shared `RecipeParser` test fixture
+    :param patch: JSON patch that targets an invalid path
     """
-    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    assert not invalid_path_parser.patch(patch)
+    # The shared parser must never be modified by a patch that fails to find its path.
+    assert not invalid_path_parser.is_modified()
 
-    # Passing an empty path fails at the JSON schema validation layer, so it applies to all patch functions.
-    with pytest.raises(JsonPatchValidationException):
-        assert not (
-            parser.patch(
-                {
-                    "op": "test",
-                    "path": "",
-                    "value": 42,
-                }
-            )
-        )
 
-    # add
-    assert not (
-        parser.patch(
-            {
-                "op": "add",
-                "path": "/package/path/to/fake/value",
-                "value": 42,
-            }
-        )
+def test_patch_test() -> None:
+    """
+    Tests the `test` patch op. The `test` op may be useful for other test assertions, so it is tested before the other
+    patch operations.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+
+    # Test that values match, as expected
+    assert parser.patch(
+        {
+            "op": "test",
+            "path": "/build/number",
+            "value": 0,
+        }
     )
-    assert not (
-        parser.patch(
-            {
-                "op": "add",
-                "path": "/build/number/0",
-                "value": 42,
-            }
-        )
+    assert parser.patch(
+        {
+            "op": "test",
+            "path": "/build",
+            "value": {
+                "number": 0,
+                "skip": True,
+                "is_true": True,
+            },
+        }
     )
-    assert not (
-        parser.patch(
-            {
-                "op": "add",
-                "path": "/multi_level/list2/4",
-                "value": 42,
-            }
-        )
+    assert parser.patch(
+        {
+            "op": "test",
+            "path": "/requirements/host",
+            "value": ["setuptools", "fakereq"],
+        }
     )
-    # remove
-    assert not (
-        parser.patch(
-            {
-                "op": "remove",
-                "path": "/package/path/to/fake/value",
-            }
-        )
+    assert parser.patch(
+        {
+            "op": "test",
+            "path": "/requirements/host/1",
+            "value": "fakereq",
+        }
     )
-    assert not (
-        parser.patch(
-            {
-                "op": "remove",
-                "path": "/build/number/0",
-            }
-        )
+    assert parser.patch(
+        {
+            "op": "test",
+            "path": "/about/description",
+            "value": SIMPLE_DESCRIPTION,
+        }
     )
+    # Test that values do not match, as expected
     assert not (
         parser.patch(
             {
-                "op": "remove",
-                "path": "/multi_level/list2/4",
+                "op": "test",
+                "path": "/build/number",
+                "value": 42,
             }
         )
     )
     assert not (
         parser.patch(
             {
-                "op": "remove",
-                "path": "/build/skip/true",
+                "op": "test",
+                "path": "/build",
+                "value": {
+                    "number": 42,
+                    "skip": True,
+                },
             }
         )
     )
-    # replace
     assert not (
         parser.patch(
             {
-                "op": "replace",
-                "path": "/build/number/0",
-                "value": 42,
+                "op": "test",
+                "path": "/requirements/host",
+                "value": ["not_setuptools", "fakereq"],
             }
         )
     )
     assert not (
         parser.patch(
             {
-                "op": "replace",
-                "path": "/multi_level/list2/4",
-                "value": 42,
+                "op": "test",
+                "path": "/requirements/host/1",
+                "value": "other_fake",
             }
         )
     )
     assert not (
         parser.patch(
             {
-                "op": "replace",
-                "path": "/build/skip/true",
-                "value": 42,
+                "op": "test",
+                "path": "/about/description",
+                "value": "other_fake\nmultiline",
             }
         )
     )
-    assert not (
-        parser.patch(
-            {
-                "op": "replace",
-                "path": "/package/path/to/fake/value",
-                "value": 42,
-            }
-        )
+
+    # Ensure that `test` does not modify the tree
+    assert not parser.is_modified()
+
+
+def test_patch_add() -> None:
+    """
+    Tests the `add` patch op.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+
+    # As per the RFC, `add` will not construct multiple-levels of non-existing structures. The containing
+    # object(s)/list(s) must exist.
+    assert not parser.patch(
+        {
+            "op": "add",
+            "path": "/build/fake/meaning_of_life",
+            "value": 42,
+        }
+    )
+    # Similarly, appending to a list
+    assert not parser.patch(
+        {
+            "op": "add",
+            "path": "/requirements/empty_field1/-/blah",
+            "value": 42,
+        }
     )
+    assert not parser.is_modified()
 
-    # move, `path` is invalid
-    assert not (
-        parser.patch(
-            {
-                "op": "move",
-                "path": "/package/path/to/fake/value",
-                "from": "/about/summary",
-            }
-        )
-    )
-    assert not (
-        parser.patch(
-            {
-                "op": "move",
-                "path": "/build/number/0",
-                "from": "/about/summary",
-            }
-        )
-    )
-    assert not (
-        parser.patch(
-            {
-                "op": "move",
-                "path": "/multi_level/list2/4",
-                "from": "/about/summary",
-            }
-        )
-    )
-    # move, `from` is invalid
-    assert not (
-        parser.patch(
-            {
-                "op": "move",
-                "from": "/package/path/to/fake/value",
-                "path": "/about/summary",
-            }
-        )
-    )
-    assert not (
-        parser.patch(
-            {
-                "op": "move",
-                "from": "/build/number/0",
-                "path": "/about/summary",
-            }
-        )
-    )
-    assert not (
-        parser.patch(
-            {
-                "op": "move",
-                "from": "/multi_level/list2/4",
-                "path": "/about/summary",
-            }
+    assert all(
+        parser.patch_many(
+            [
+                # Add primitive values
+                {
+                    "op": "add",
+                    "path": "/build/meaning_of_life",
+                    "value": 42,
+                },
+                {
+                    "op": "add",
+                    "path": "/package/is_cool_name",
+                    "value": True,
+                },
+                # Add to empty-key node
+                {
+                    "op": "add",
+                    "path": "/requirements/empty_field2",
+                    "value": "Not so empty now",
+                },
+                # Add list items
+                {
+                    "op": "add",
+                    "path": "/multi_level/list_2/1",
+                    "value": "We got it all on UHF",
+                },
+                {
+                    "op": "add",
+                    "path": "/multi_level/list_1/0",
+                    "value": "There's just one place to go for all your spatula needs!",
+                },
+                {
+                    "op": "add",
+                    "path": "/multi_level/list_1/-",
+                    "value": "Spatula City!",
+                },
+                # Add a complex value
+                {
+                    "op": "add",
+                    "path": "/test_var_usage/Stanley",
+                    "value": [
+                        "Oh, Joel Miller, you've just found the marble in the oatmeal.",
+                        "You're a lucky, lucky, lucky little boy.",
+                        "'Cause you know why?",
+                        "You get to drink from... the FIRE HOOOOOSE!",
+                    ],
+                },
+                # Add a top-level complex value
+                {
+                    "op": "add",
+                    "path": "/U62",
+                    "value": {
+                        "George": ["How'd you like your own TV show?", "You're on"],
+                        "Stanley": ["Ok"],
+                    },
+                },
+                # Add an object to a list
+                {
+                    "op": "add",
+                    "path": "/multi_level/list_3/1",
+                    "value": {
+                        "George": {"role": "owner", "has_mop": False},
+                        "Stanley": {"role": "janitor", "has_mop": True},
+                    },
+                },
+                # Edge case: adding a value to an existing key (non-list) actually replaces the value at that key, as
+                # per the RFC.
+                {"op": "add", "path": "/about/summary", "value": 62},
+                # Add a value in a list with a comment
+                {"op": "add", "path": "/multi_level/list_1/1", "value": "ken"},
+                {"op": "add", "path": "/multi_level/list_1/3", "value": "barbie"},
+            ]
         )
     )
 
-    # copy, `path` is invalid
-    assert not (
-        parser.patch(
-            {
-                "op": "copy",
-                "path": "/package/path/to/fake/value",
-                "from": "/about/summary",
-            }
-        )
-    )
-    assert not (
-        parser.patch(
-            {
-                "op": "copy",
-                "path": "/build/number/0",
-                "from": "/about/summary",
-            }
-        )
-    )
-    assert not (
-        parser.patch(
-            {
-                "op": "copy",
-                "path": "/multi_level/list2/4",
-                "from": "/about/summary",
-            }
-        )
-    )
-    # copy, `from` is invalid
-    assert not (
-        parser.patch(
-            {
-                "op": "copy",
-                "from": "/package/path/to/fake/value",
-                "path": "/about/summary",
-            }
-        )
-    )
-    assert not (
-        parser.patch(
-            {
-                "op": "copy",
-                "from": "/build/number/0",
-                "path": "/about/summary",
-            }
-        )
-    )
-    assert not (
-        parser.patch(
-            {
-                "op": "copy",
-                "from": "/multi_level/list2/4",
-                "path": "/about/summary",
-            }
-        )
-    )
-
-    # test
-    assert not (
-        parser.patch(
-            {
-                "op": "test",
-                "path": "/package/path/to/fake/value",
-                "value": 42,
-            }
-        )
-    )
-
-    assert not parser.is_modified()
-
-
-def test_patch_test() -> None:
-    """
-    Tests the `test` patch op. The `test` op may be useful for other test assertions, so it is tested before the other
-    patch operations.
-    """
-    parser = load_recipe("simple-recipe.yaml", RecipeParser)
-
-    # Test that values match, as expected
-    assert parser.patch(
-        {
-            "op": "test",
-            "path": "/build/number",
-            "value": 0,
-        }
-    )
-    assert parser.patch(
-        {
-            "op": "test",
-            "path": "/build",
-            "value": {
-                "number": 0,
-                "skip": True,
-                "is_true": True,
-            },
-        }
-    )
-    assert parser.patch(
-        {
-            "op": "test",
-            "path": "/requirements/host",
-            "value": ["setuptools", "fakereq"],
-        }
-    )
-    assert parser.patch(
-        {
-            "op": "test",
-            "path": "/requirements/host/1",
-            "value": "fakereq",
-        }
-    )
-    assert parser.patch(
-        {
-            "op": "test",
-            "path": "/about/description",
-            "value": SIMPLE_DESCRIPTION,
-        }
-    )
-    # Test that values do not match, as expected
-    assert not (
-        parser.patch(
-            {
-                "op": "test",
-                "path": "/build/number",
-                "value": 42,
-            }
-        )
-    )
-    assert not (
-        parser.patch(
-            {
-                "op": "test",
-                "path": "/build",
-                "value": {
-                    "number": 42,
-                    "skip": True,
-                },
-            }
-        )
-    )
-    assert not (
-        parser.patch(
-            {
-                "op": "test",
-                "path": "/requirements/host",
-                "value": ["not_setuptools", "fakereq"],
-            }
-        )
-    )
-    assert not (
-        parser.patch(
-            {
-                "op": "test",
-                "path": "/requirements/host/1",
-                "value": "other_fake",
-            }
-        )
-    )
-    assert not (
-        parser.patch(
-            {
-                "op": "test",
-                "path": "/about/description",
-                "value": "other_fake\nmultiline",
-            }
-        )
-    )
-
-    # Ensure that `test` does not modify the tree
-    assert not parser.is_modified()
-
-
-def test_patch_add() -> None:
-    """
-    Tests the `add` patch op.
-    """
-    parser = load_recipe("simple-recipe.yaml", RecipeParser)
-
-    # As per the RFC, `add` will not construct multiple-levels of non-existing structures. The containing
-    # object(s)/list(s) must exist.
-    assert not parser.patch(
-        {
-            "op": "add",
-            "path": "/build/fake/meaning_of_life",
-            "value": 42,
-        }
-    )
-    # Similarly, appending to a list
-    assert not parser.patch(
-        {
-            "op": "add",
-            "path": "/requirements/empty_field1/-/blah",
-            "value": 42,
-        }
-    )
-    assert not parser.is_modified()
-
-    # Add primitive values
-    assert parser.patch(
-        {
-            "op": "add",
-            "path": "/build/meaning_of_life",
-            "value": 42,
-        }
-    )
-    assert parser.patch(
-        {
-            "op": "add",
-            "path": "/package/is_cool_name",
-            "value": True,
-        }
-    )
-
-    # Add to empty-key node
-    assert parser.patch(
-        {
-            "op": "add",
-            "path": "/requirements/empty_field2",
-            "value": "Not so empty now",
-        }
-    )
-
-    # Add list items
-    assert parser.patch(
-        {
-            "op": "add",
-            "path": "/multi_level/list_2/1",
-            "value": "We got it all on UHF",
-        }
-    )
-    assert parser.patch(
-        {
-            "op": "add",
-            "path": "/multi_level/list_1/0",
-            "value": "There's just one place to go for all your spatula needs!",
-        }
-    )
-    assert parser.patch(
-        {
-            "op": "add",
-            "path": "/multi_level/list_1/-",
-            "value": "Spatula City!",
-        }
-    )
-
-    # Add a complex value
-    assert parser.patch(
-        {
-            "op": "add",
-            "path": "/test_var_usage/Stanley",
-            "value": [
-                "Oh, Joel Miller, you've just found the marble in the oatmeal.",
-                "You're a lucky, lucky, lucky little boy.",
-                "'Cause you know why?",
-                "You get to drink from... the FIRE HOOOOOSE!",
-            ],
-        }
-    )
-
-    # Add a top-level complex value
-    assert parser.patch(
-        {
-            "op": "add",
-            "path": "/U62",
-            "value": {
-                "George": ["How'd you like your own TV show?", "You're on"],
-                "Stanley": ["Ok"],
-            },
-        }
-    )
-
-    # Add an object to a list
-    assert parser.patch(
-        {
-            "op": "add",
-            "path": "/multi_level/list_3/1",
-            "value": {
-                "George": {"role": "owner", "has_mop": False},
-                "Stanley": {"role": "janitor", "has_mop": True},
-            },
-        }
-    )
-
-    # Edge case: adding a value to an existing key (non-list) actually replaces the value at that key, as per the RFC.
-    assert parser.patch({"op": "add", "path": "/about/summary", "value": 62})
-
-    # Add a value in a list with a comment
-    assert parser.patch({"op": "add", "path": "/multi_level/list_1/1", "value": "ken"})
-    assert parser.patch({"op": "add", "path": "/multi_level/list_1/3", "value": "barbie"})
-
     # Sanity check: validate all modifications
     assert parser.is_modified()
     assert parser.render() == load_file("simple-recipe_test_patch_add.yaml")
@@ -879,91 +652,74 @@ def test_patch_replace() -> None:
     Tests the `replace` patch op.
     """
     parser = load_recipe("simple-recipe.yaml", RecipeParser)
-    # Patch an integer
-    assert parser.patch(
-        {
-            "op": "replace",
-            "path": "/build/number",
-            "value": 42,
-        }
-    )
-    # Patch a bool
-    assert parser.patch(
-        {
-            "op": "replace",
-            "path": "/build/is_true",
-            "value": False,
-        }
-    )
-    # Patch a string
-    assert parser.patch(
-        {
-            "op": "replace",
-            "path": "/about/license",
-            "value": "MIT",
-        }
-    )
-    # Patch an array element
-    assert parser.patch(
-        {
-            "op": "replace",
-            "path": "/requirements/run/0",
-            "value": "cpython",
-        }
-    )
-    # Patch an element to become an array
-    assert parser.patch(
-        {
-            "op": "replace",
-            "path": "/about/summary",
-            "value": [
-                "The Trial",
-                "Never Ends",
-                "Picard",
-            ],
-        }
-    )
-    # Patch a multiline string
-    assert parser.patch(
-        {
-            "op": "replace",
-            "path": "/about/description",
-            "value": ("This is a PEP 561\ntype stub package\nfor the toml package."),
-        }
-    )
-
-    # Hard mode: replace a string with an object containing multiple types in a complex data structure.
-    assert parser.patch(
-        {
-            "op": "replace",
-            "path": "/multi_level/list_2/1",
-            "value": {"build": {"number": 42, "skip": True}},
-        }
-    )
-
-    # Patch-in strings with quotes
-    assert parser.patch(
-        {
-            "op": "replace",
-            "path": "/multi_level/list_3/2",
-            "value": "{{ compiler('c') }}",
-        }
-    )
-
-    # Patch lists with comments
-    assert parser.patch(
-        {
-            "op": "replace",
-            "path": "/multi_level/list_1/0",
-            "value": "ken",
-        }
-    )
-    assert parser.patch(
-        {
-            "op": "replace",
-            "path": "/multi_level/list_1/1",
-            "value": "barbie",
-        }
+    assert all(
+        parser.patch_many(
+            [
+                # Patch an integer
+                {
+                    "op": "replace",
+                    "path": "/build/number",
+                    "value": 42,
+                },
+                # Patch a bool
+                {
+                    "op": "replace",
+                    "path": "/build/is_true",
+                    "value": False,
+                },
+                # Patch a string
+                {
+                    "op": "replace",
+                    "path": "/about/license",
+                    "value": "MIT",
+                },
+                # Patch an array element
+                {
+                    "op": "replace",
+                    "path": "/requirements/run/0",
+                    "value": "cpython",
+                },
+                # Patch an element to become an array
+                {
+                    "op": "replace",
+                    "path": "/about/summary",
+                    "value": [
+                        "The Trial",
+                        "Never Ends",
+                        "Picard",
+                    ],
+                },
+                # Patch a multiline string
+                {
+                    "op": "replace",
+                    "path": "/about/description",
+                    "value": ("This is a PEP 561\ntype stub package\nfor the toml package."),
+                },
+                # Hard mode: replace a string with an object containing multiple types in a complex data structure.
+                {
+                    "op": "replace",
+                    "path": "/multi_level/list_2/1",
+                    "value": {"build": {"number": 42, "skip": True}},
+                },
+                # Patch-in strings with quotes
+                {
+                    "op": "replace",
+                    "path": "/multi_level/list_3/2",
+                    "value": "{{ compiler('c') }}",
+                },
+                # Patch lists with comments
+                {
+                    "op": "replace",
+                    "path": "/multi_level/list_1/0",
+                    "value": "ken",
+                },
+                {
+                    "op": "replace",
+                    "path": "/multi_level/list_1/1",
+                    "value": "barbie",
+                },
+            ]
+        )
     )
 
     # Sanity check: validate all modifications
@@ -996,49 +752,41 @@ def test_patch_move() -> None:
     assert not parser.is_modified()
     assert parser.render() == load_file("simple-recipe.yaml")
 
-    # Simple move
-    assert parser.patch(
-        {
-            "op": "move",
-            "path": "/requirements/number",
-            "from": "/build/number",
-        }
-    )
-
-    # Moving list item to a new key (replaces existing value)
-    assert parser.patch(
-        {
-            "op": "move",
-            "path": "/build/is_true",
-            "from": "/multi_level/list_3/0",
-        }
-    )
-
-    # Moving list item to a different list
-    assert parser.patch(
-        {
-            "op": "move",
-            "path": "/requirements/host/-",
-            "from": "/multi_level/list_1/1",
-        }
-    )
-
-    # Moving a list entry to another list entry position
-    assert parser.patch(
-        {
-            "op": "move",
-            "path": "/multi_level/list_2/0",
-            "from": "/multi_level/list_2/1",
-        }
-    )
-
-    # Moving a compound type
-    assert parser.patch(
-        {
-            "op": "move",
-            "path": "/multi_level/bar",
-            "from": "/test_var_usage/bar",
-        }
+    assert all(
+        parser.patch_many(
+            [
+                # Simple move
+                {
+                    "op": "move",
+                    "path": "/requirements/number",
+                    "from": "/build/number",
+                },
+                # Moving list item to a new key (replaces existing value)
+                {
+                    "op": "move",
+                    "path": "/build/is_true",
+                    "from": "/multi_level/list_3/0",
+                },
+                # Moving list item to a different list
+                {
+                    "op": "move",
+                    "path": "/requirements/host/-",
+                    "from": "/multi_level/list_1/1",
+                },
+                # Moving a list entry to another list entry position
+                {
+                    "op": "move",
+                    "path": "/multi_level/list_2/0",
+                    "from": "/multi_level/list_2/1",
+                },
+                # Moving a compound type
+                {
+                    "op": "move",
+                    "path": "/multi_level/bar",
+                    "from": "/test_var_usage/bar",
+                },
+            ]
+        )
     )
 
     # Sanity check: validate all modifications
@@ -1053,49 +801,41 @@ def test_patch_copy() -> None:
     """
     parser = load_recipe("simple-recipe.yaml", RecipeParser)
 
-    # Simple copy
-    assert parser.patch(
-        {
-            "op": "copy",
-            "path": "/requirements/number",
-            "from": "/build/number",
-        }
-    )
-
-    # Copying list item to a new key
-    assert parser.patch(
-        {
-            "op": "copy",
-            "path": "/build/is_true",
-            "from": "/multi_level/list_3/0",
-        }
-    )
-
-    # Copying list item to a different list
-    assert parser.patch(
-        {
-            "op": "copy",
-            "path": "/requirements/host/-",
-            "from": "/multi_level/list_1/1",
-        }
-    )
-
-    # Copying a list entry to another list entry position
-    assert parser.patch(
-        {
-            "op": "copy",
-            "path": "/multi_level/list_2/0",
-            "from": "/multi_level/list_2/1",
-        }
-    )
-
-    # Copying a compound type
-    assert parser.patch(
-        {
-            "op": "copy",
-            "path": "/multi_level/bar",
-            "from": "/test_var_usage/bar",
-        }
+    assert all(
+        parser.patch_many(
+            [
+                # Simple copy
+                {
+                    "op": "copy",
+                    "path": "/requirements/number",
+                    "from": "/build/number",
+                },
+                # Copying list item to a new key
+                {
+                    "op": "copy",
+                    "path": "/build/is_true",
+                    "from": "/multi_level/list_3/0",
+                },
+                # Copying list item to a different list
+                {
+                    "op": "copy",
+                    "path": "/requirements/host/-",
+                    "from": "/multi_level/list_1/1",
+                },
+                # Copying a list entry to another list entry position
+                {
+                    "op": "copy",
+                    "path": "/multi_level/list_2/0",
+                    "from": "/multi_level/list_2/1",
+                },
+                # Copying a compound type
+                {
+                    "op": "copy",
+                    "path": "/multi_level/bar",
+                    "from": "/test_var_usage/bar",
+                },
+            ]
+        )
     )
 
     # Sanity check: validate all modifications
@@ -1104,12 +844,106 @@ def test_patch_copy() -> None:
     assert parser.render() == load_file("simple-recipe_test_patch_copy.yaml")
 
 
-def test_search_and_patch() -> None:
+@pytest.mark.parametrize(
+    "file,patches,expected_results,expected_unix_paths",
+    [
+        (
+            "simple-recipe.yaml",
+            [
+                # Fails, but does not prevent the remaining patches from being performed
+                {"op": "add", "path": "/build/fake/meaning_of_life", "value": 42},
+                {"op": "add", "path": "/build/meaning_of_life", "value": 42},
+                # Later patches operate on the results of earlier patches
+                {"op": "test", "path": "/build/meaning_of_life", "value": 42},
+                {"op": "replace", "path": "/build/meaning_of_life", "value": 62},
+                {"op": "move", "path": "/about/meaning_of_life", "from": "/build/meaning_of_life"},
+                {"op": "add", "path": "/multi_level/list_1/-", "value": "Spatula City!"},
+                {"op": "remove", "path": "/requirements/empty_field3"},
+                # Shifts the path of the `[unix]` selector on `/requirements/host/1`
+                {"op": "remove", "path": "/requirements/host/0"},
+            ],
+            [False, True, True, True, True, True, True, True],
+            ["/package/name", "/requirements/host/0"],
+        ),
+        (
+            "v1_format/v1_simple-recipe.yaml",
+            [
+                {"op": "replace", "path": "/build/number", "value": 42},
+                {"op": "test", "path": "/build/number", "value": 0},
+                {"op": "copy", "path": "/about/number", "from": "/build/number"},
+            ],
+            [True, False, True],
+            [],
+        ),
+    ],
+)
+def test_patch_many(
+    file: str, patches: list[JsonPatchType], expected_results: list[bool], expected_unix_paths: list[str]
+) -> None:
+    """
+    Ensures that performing a batch of patches is equivalent to performing each patch individually.
+
+    :param file: File to test against
+    :param patches: JSON patches to perform, in order
+    :param expected_results: Expected result of each patch operation
+    :param expected_unix_paths: Expected paths of the `[unix]` selector, after all patches have been performed
+    """
+    parser = load_recipe(file, RecipeParser)
+    expected_parser = load_recipe(file, RecipeParser)
+
+    assert parser.patch_many(patches) == expected_results
+    assert [expected_parser.patch(patch) for patch in patches] == expected_results
+
+    assert parser.is_modified() == expected_parser.is_modified()
+    assert parser.render() == expected_parser.render()
+    # The selector table is only rebuilt once, so it must match the table built after every individual patch.
+    assert parser.list_selectors() == expected_parser.list_selectors()
+    assert parser.get_selector_paths("[unix]") == expected_unix_paths
+
+
+def test_patch_many_stop_on_failure() -> None:
+    """
+    Ensures that no further patches are performed after a failed patch, when requested.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    assert parser.patch_many(
+        [
+            {"op": "remove", "path": "/requirements/host/0"},
+            {"op": "add", "path": "/build/fake/meaning_of_life", "value": 42},
+            {"op": "add", "path": "/build/meaning_of_life", "value": 42},
+        ],
+        stop_on_failure=True,
+    ) == [True, False]
+    assert not parser.contains_value("/build/meaning_of_life")
+    # Patches performed before the failure still update the selector table.
+    assert parser.get_selector_paths("[unix]") == ["/package/name", "/requirements/host/0"]
+
+
+def test_patch_many_validates_all_patches() -> None:
+    """
+    Ensures that no patches are performed if any patch in the batch fails JSON patch schema validation.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    with pytest.raises(JsonPatchValidationException):
+        parser.patch_many(
+            [
+                {"op": "replace", "path": "/build/number", "value": 42},
+                {"op": "fakeop", "path": "/build/number", "value": 42},
+            ]
+        )
+    assert not parser.is_modified()
+    assert parser.render() == load_file("simple-recipe.yaml")
+
+
+@pytest.mark.parametrize("regex", [r"py.*", re.compile(r"py.*")])
+def test_search_and_patch(regex: str | re.Pattern[str]) -> None:
     """
     Tests searching for values and then patching them
+
+    :param regex: Regular expression to search with, as a string or as a pre-compiled pattern
     """
     parser = load_recipe("simple-recipe.yaml", RecipeParser)
-    assert parser.search_and_patch(r"py.*", {"op": "replace", "value": "conda"}, True)
+    assert parser.search_and_patch(regex, {"op": "replace", "value": "conda"}, True)
     assert parser.render() == load_file("simple-recipe_test_search_and_patch.yaml")
     assert parser.is_modified()
 
@@ -3,7 +3,7 @@
 """
 
 from pathlib import Path
-from typing import Final, cast
+from typing import Final
 
 import pytest
 from conda.models.match_spec import MatchSpec
@@ -32,14 +32,14 @@ from tests.file_loading import get_test_path
         ),
     ],
 )
-def test_scan(project_name: str, expected: set[ProjectDependency], request: pytest.FixtureRequest) -> None:
+def test_scan(project_name: str, expected: set[ProjectDependency], fs: FakeFilesystem) -> None:
     """
     Tests scanning for Python dependencies with a mocked-out Python project.
 
     :param project_name: Name of the dummy Python project directory to use
     :param expected: Expected value
+    :param fs: pyfakefs fixture used to replace the file system
     """
-    fs = cast(FakeFilesystem, request.getfixturevalue("fs"))
     project_path: Final[Path] = get_test_path() / "software_projects" / project_name
     fs.add_real_directory(project_path)
 